@@ -9,11 +9,21 @@ find hidden treasures, and make the village feel truly alive.
 
 from __future__ import annotations
 
+import bisect
 import enum
+import itertools
 import random
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Bound once so the per-pet, per-day hot paths skip the module attribute
+# lookup. These are methods of the shared generator, so random.seed()
+# still governs them. Weighted picks bisect precomputed cumulative weights
+# directly, which is what random.choices(cum_weights=...) does internally
+# and so consumes the same draws.
+_rand = random.random
+_choice = random.choice
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -53,15 +63,15 @@ class BondTier(enum.Enum):
 
     @classmethod
     def from_points(cls, points: int) -> BondTier:
-        if points >= 120:
-            return cls.SOULBOUND
-        if points >= 80:
-            return cls.DEVOTED
-        if points >= 40:
-            return cls.COMPANION
-        if points >= 15:
-            return cls.FAMILIAR
-        return cls.STRANGER
+        return _BOND_TIERS[bisect.bisect_right(_BOND_THRESHOLDS, points)]
+
+
+# Lower bound of each tier above STRANGER, in ascending order.
+_BOND_THRESHOLDS: tuple[int, ...] = (15, 40, 80, 120)
+_BOND_TIERS: tuple[BondTier, ...] = (
+    BondTier.STRANGER, BondTier.FAMILIAR, BondTier.COMPANION,
+    BondTier.DEVOTED, BondTier.SOULBOUND,
+)
 
 
 class PetMood(enum.Enum):
@@ -86,7 +96,7 @@ class PetActivity(enum.Enum):
 # Species data tables
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpeciesProfile:
     """Static data about a pet species."""
     species: Species
@@ -164,120 +174,183 @@ _PERSONALITY_MOOD: dict[PetPersonality, dict[PetMood, float]] = {
     PetPersonality.GENTLE:      {PetMood.ECSTATIC: 0.15, PetMood.HAPPY: 0.30, PetMood.CONTENT: 0.35, PetMood.RESTLESS: 0.05, PetMood.LONELY: 0.15},
 }
 
+# (moods, cumulative weights) per personality, for a bisect pick.
+_PERSONALITY_MOOD_PREPARED: dict[PetPersonality, tuple[tuple[PetMood, ...], tuple[float, ...]]] = {
+    personality: (tuple(weights.keys()), tuple(itertools.accumulate(weights.values())))
+    for personality, weights in _PERSONALITY_MOOD.items()
+}
+
 
 # ---------------------------------------------------------------------------
 # Found item table
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+class Rarity(enum.IntEnum):
+    COMMON = 0
+    UNCOMMON = 1
+    RARE = 2
+    UNKNOWN = 3    # any label outside the ones above
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+# Indexed by Rarity
+_RARITY_VALUE: tuple[float, ...] = (2.0, 5.0, 12.0, 1.0)
+_RARITY_WEIGHT: tuple[float, ...] = (0.65, 0.28, 0.07)  # forage table tiers only
+
+
+@dataclass(frozen=True, slots=True)
 class FoundItem:
     """An item discovered by a pet while foraging."""
     name: str
     category: str
-    rarity: str       # "common", "uncommon", "rare"
+    rarity: Rarity    # a label such as "common" is also accepted
     description: str
 
+    def __post_init__(self) -> None:
+        if isinstance(self.rarity, str):
+            object.__setattr__(
+                self, "rarity",
+                Rarity.__members__.get(self.rarity.upper(), Rarity.UNKNOWN),
+            )
+
     @property
     def value(self) -> float:
-        return {"common": 2.0, "uncommon": 5.0, "rare": 12.0}.get(self.rarity, 1.0)
+        return _RARITY_VALUE[self.rarity]
 
 
 _FORAGE_TABLE: dict[str, list[FoundItem]] = {
     "fish": [
-        FoundItem("Small Trout", "fish", "common", "A wriggling little fish."),
-        FoundItem("Silver Perch", "fish", "uncommon", "Scales gleam like tiny mirrors."),
-        FoundItem("Golden Koi", "fish", "rare", "A legendary pond fish of good fortune."),
+        FoundItem("Small Trout", "fish", Rarity.COMMON, "A wriggling little fish."),
+        FoundItem("Silver Perch", "fish", Rarity.UNCOMMON, "Scales gleam like tiny mirrors."),
+        FoundItem("Golden Koi", "fish", Rarity.RARE, "A legendary pond fish of good fortune."),
     ],
     "gemstone": [
-        FoundItem("Quartz Pebble", "gemstone", "common", "A smooth, cloudy stone."),
-        FoundItem("Amethyst Shard", "gemstone", "uncommon", "Purple crystal fragment."),
-        FoundItem("Star Sapphire", "gemstone", "rare", "A deep blue gem with a star inside."),
+        FoundItem("Quartz Pebble", "gemstone", Rarity.COMMON, "A smooth, cloudy stone."),
+        FoundItem("Amethyst Shard", "gemstone", Rarity.UNCOMMON, "Purple crystal fragment."),
+        FoundItem("Star Sapphire", "gemstone", Rarity.RARE, "A deep blue gem with a star inside."),
     ],
     "trinket": [
-        FoundItem("Old Button", "trinket", "common", "Brass, slightly tarnished."),
-        FoundItem("Glass Marble", "trinket", "uncommon", "Swirled with green and gold."),
-        FoundItem("Tiny Music Box", "trinket", "rare", "Plays a soft, mysterious tune."),
+        FoundItem("Old Button", "trinket", Rarity.COMMON, "Brass, slightly tarnished."),
+        FoundItem("Glass Marble", "trinket", Rarity.UNCOMMON, "Swirled with green and gold."),
+        FoundItem("Tiny Music Box", "trinket", Rarity.RARE, "Plays a soft, mysterious tune."),
     ],
     "stick": [
-        FoundItem("Ordinary Stick", "stick", "common", "The best stick in the world."),
-        FoundItem("Gnarled Branch", "stick", "uncommon", "Twisted into an interesting shape."),
-        FoundItem("Petrified Twig", "stick", "rare", "Ancient wood turned to stone."),
+        FoundItem("Ordinary Stick", "stick", Rarity.COMMON, "The best stick in the world."),
+        FoundItem("Gnarled Branch", "stick", Rarity.UNCOMMON, "Twisted into an interesting shape."),
+        FoundItem("Petrified Twig", "stick", Rarity.RARE, "Ancient wood turned to stone."),
     ],
     "bone": [
-        FoundItem("Old Bone", "bone", "common", "Probably from a rabbit. Probably."),
-        FoundItem("Carved Bone", "bone", "uncommon", "Etched with tiny rune-like marks."),
-        FoundItem("Dragon Tooth", "bone", "rare", "Far too large. Best not think about it."),
+        FoundItem("Old Bone", "bone", Rarity.COMMON, "Probably from a rabbit. Probably."),
+        FoundItem("Carved Bone", "bone", Rarity.UNCOMMON, "Etched with tiny rune-like marks."),
+        FoundItem("Dragon Tooth", "bone", Rarity.RARE, "Far too large. Best not think about it."),
     ],
     "foraged": [
-        FoundItem("Acorn", "foraged", "common", "A shiny brown acorn."),
-        FoundItem("Four-Leaf Clover", "foraged", "uncommon", "Lucky!"),
-        FoundItem("Ancient Seed", "foraged", "rare", "It hums faintly when you hold it."),
+        FoundItem("Acorn", "foraged", Rarity.COMMON, "A shiny brown acorn."),
+        FoundItem("Four-Leaf Clover", "foraged", Rarity.UNCOMMON, "Lucky!"),
+        FoundItem("Ancient Seed", "foraged", Rarity.RARE, "It hums faintly when you hold it."),
     ],
     "herb": [
-        FoundItem("Wild Mint", "herb", "common", "Fresh and fragrant."),
-        FoundItem("Healing Herb", "herb", "uncommon", "Leaves shimmer faintly."),
-        FoundItem("Moonpetal Sprig", "herb", "rare", "Glows softly after dark."),
+        FoundItem("Wild Mint", "herb", Rarity.COMMON, "Fresh and fragrant."),
+        FoundItem("Healing Herb", "herb", Rarity.UNCOMMON, "Leaves shimmer faintly."),
+        FoundItem("Moonpetal Sprig", "herb", Rarity.RARE, "Glows softly after dark."),
     ],
     "flower": [
-        FoundItem("Daisy", "flower", "common", "Simple and cheerful."),
-        FoundItem("Wild Orchid", "flower", "uncommon", "Delicate purple petals."),
-        FoundItem("Enchanted Rose", "flower", "rare", "Never wilts, always fragrant."),
+        FoundItem("Daisy", "flower", Rarity.COMMON, "Simple and cheerful."),
+        FoundItem("Wild Orchid", "flower", Rarity.UNCOMMON, "Delicate purple petals."),
+        FoundItem("Enchanted Rose", "flower", Rarity.RARE, "Never wilts, always fragrant."),
     ],
     "vegetable": [
-        FoundItem("Wild Carrot", "vegetable", "common", "Small but crunchy."),
-        FoundItem("Golden Turnip", "vegetable", "uncommon", "Unusually lustrous."),
-        FoundItem("Fairy Radish", "vegetable", "rare", "Sparkles in sunlight."),
+        FoundItem("Wild Carrot", "vegetable", Rarity.COMMON, "Small but crunchy."),
+        FoundItem("Golden Turnip", "vegetable", Rarity.UNCOMMON, "Unusually lustrous."),
+        FoundItem("Fairy Radish", "vegetable", Rarity.RARE, "Sparkles in sunlight."),
     ],
     "rare_book": [
-        FoundItem("Torn Page", "rare_book", "common", "Fragment of an old text."),
-        FoundItem("Leather Journal", "rare_book", "uncommon", "Filled with observations."),
-        FoundItem("Enchanted Tome", "rare_book", "rare", "The pages turn themselves."),
+        FoundItem("Torn Page", "rare_book", Rarity.COMMON, "Fragment of an old text."),
+        FoundItem("Leather Journal", "rare_book", Rarity.UNCOMMON, "Filled with observations."),
+        FoundItem("Enchanted Tome", "rare_book", Rarity.RARE, "The pages turn themselves."),
     ],
     "feather": [
-        FoundItem("Grey Feather", "feather", "common", "Soft and downy."),
-        FoundItem("Owl Plume", "feather", "uncommon", "Striped brown and cream."),
-        FoundItem("Phoenix Feather", "feather", "rare", "Warm to the touch."),
+        FoundItem("Grey Feather", "feather", Rarity.COMMON, "Soft and downy."),
+        FoundItem("Owl Plume", "feather", Rarity.UNCOMMON, "Striped brown and cream."),
+        FoundItem("Phoenix Feather", "feather", Rarity.RARE, "Warm to the touch."),
     ],
     "ancient_coin": [
-        FoundItem("Copper Penny", "ancient_coin", "common", "Worn and green with age."),
-        FoundItem("Silver Ducat", "ancient_coin", "uncommon", "An old trading coin."),
-        FoundItem("Golden Relic Coin", "ancient_coin", "rare", "Stamped with a forgotten king."),
+        FoundItem("Copper Penny", "ancient_coin", Rarity.COMMON, "Worn and green with age."),
+        FoundItem("Silver Ducat", "ancient_coin", Rarity.UNCOMMON, "An old trading coin."),
+        FoundItem("Golden Relic Coin", "ancient_coin", Rarity.RARE, "Stamped with a forgotten king."),
     ],
     "mushroom": [
-        FoundItem("Button Mushroom", "mushroom", "common", "Cute and round."),
-        FoundItem("Chanterelle", "mushroom", "uncommon", "Golden and aromatic."),
-        FoundItem("Starlight Truffle", "mushroom", "rare", "Speckled with glowing dots."),
+        FoundItem("Button Mushroom", "mushroom", Rarity.COMMON, "Cute and round."),
+        FoundItem("Chanterelle", "mushroom", Rarity.UNCOMMON, "Golden and aromatic."),
+        FoundItem("Starlight Truffle", "mushroom", Rarity.RARE, "Speckled with glowing dots."),
     ],
     "rare_artifact": [
-        FoundItem("Rusted Key", "rare_artifact", "common", "Opens... something."),
-        FoundItem("Crystal Compass", "rare_artifact", "uncommon", "Points toward magic."),
-        FoundItem("Ancient Amulet", "rare_artifact", "rare", "Warm and humming with old power."),
+        FoundItem("Rusted Key", "rare_artifact", Rarity.COMMON, "Opens... something."),
+        FoundItem("Crystal Compass", "rare_artifact", Rarity.UNCOMMON, "Points toward magic."),
+        FoundItem("Ancient Amulet", "rare_artifact", Rarity.RARE, "Warm and humming with old power."),
     ],
     "berry": [
-        FoundItem("Wild Raspberry", "berry", "common", "Tart and sweet."),
-        FoundItem("Elderberry Cluster", "berry", "uncommon", "Deep purple, almost black."),
-        FoundItem("Shimmer Berry", "berry", "rare", "Translucent and faintly glowing."),
+        FoundItem("Wild Raspberry", "berry", Rarity.COMMON, "Tart and sweet."),
+        FoundItem("Elderberry Cluster", "berry", Rarity.UNCOMMON, "Deep purple, almost black."),
+        FoundItem("Shimmer Berry", "berry", Rarity.RARE, "Translucent and faintly glowing."),
     ],
 }
 
 
-def _roll_forage_item(category: str) -> Optional[FoundItem]:
-    """Pick a random item from a forage category, weighted by rarity."""
-    items = _FORAGE_TABLE.get(category, [])
-    if not items:
-        return None
-    weights = {"common": 0.65, "uncommon": 0.28, "rare": 0.07}
-    w = [weights.get(i.rarity, 0.5) for i in items]
-    return random.choices(items, weights=w, k=1)[0]
+# Per-category rarity weights, built once so foraging never rebuilds them.
+_FORAGE_WEIGHTS: dict[str, list[float]] = {
+    category: [_RARITY_WEIGHT[i.rarity] for i in items]
+    for category, items in _FORAGE_TABLE.items()
+}
+_FORAGE_CUM_WEIGHTS: dict[str, list[float]] = {
+    category: list(itertools.accumulate(weights))
+    for category, weights in _FORAGE_WEIGHTS.items()
+}
+
+
+# Each species' forage categories resolved to (items, cum_weights) pairs, so
+# a forage roll indexes straight into the pools instead of going by name.
+_SPECIES_FORAGE_POOLS: dict[Species, tuple[tuple[list[FoundItem], list[float]], ...]] = {
+    species: tuple(
+        (_FORAGE_TABLE.get(category, []), _FORAGE_CUM_WEIGHTS.get(category, []))
+        for category in profile.forage_categories
+    )
+    for species, profile in SPECIES_PROFILES.items()
+}
 
 
 # ---------------------------------------------------------------------------
 # Pet
 # ---------------------------------------------------------------------------
 
+_STATUS_FMT = (
+    "{name} the {species} ({personality}) — "
+    "Mood: {mood}  |  "
+    "Bond: {bond}pts ({tier})  |  "
+    "Energy: {energy}/100  |  "
+    "Items found: {items}"
+)
+
+# Curious pets forage better
+_CURIOUS_FORAGE_BONUS = 0.08
+# Bond points at which a pet becomes DEVOTED
+_DEVOTED_BOND_POINTS = _BOND_THRESHOLDS[_BOND_TIERS.index(BondTier.DEVOTED) - 1]
+
+
 class Pet:
     """A single animal companion in the village."""
 
+    __slots__ = (
+        "name", "species", "personality", "owner", "profile",
+        "bond_points", "mood", "energy", "activity", "found_items",
+        "days_owned", "times_pet_today", "fed_today", "favourite_villager",
+        "_interactions_today", "_base_forage_chance",
+        "_species_name", "_personality_name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -291,6 +364,9 @@ class Pet:
         self.personality = personality
         self.owner = owner
         self.profile = SPECIES_PROFILES[species]
+        # Display strings for the fixed enums, used by status() and repr()
+        self._species_name = species.value
+        self._personality_name = personality.value
 
         self.bond_points: int = 0
         self.mood: PetMood = PetMood.CONTENT
@@ -302,6 +378,11 @@ class Pet:
         self.fed_today: bool = False
         self.favourite_villager: Optional[str] = None
         self._interactions_today: int = 0
+        # Species and personality never change, so this part of the
+        # foraging odds is fixed for the pet's lifetime.
+        self._base_forage_chance: float = self.profile.base_forage_chance
+        if personality is PetPersonality.CURIOUS:
+            self._base_forage_chance += _CURIOUS_FORAGE_BONUS
 
     @property
     def bond_tier(self) -> BondTier:
@@ -321,7 +402,7 @@ class Pet:
             base += 1
         self.bond_points += base
         self.mood = _shift_mood(self.mood, 1)
-        return random.choice(_PET_REACTIONS[self.species])
+        return _choice(_PET_REACTIONS[self.species])
 
     def feed(self, food_name: str = "kibble") -> str:
         """Feed the pet. Once per day."""
@@ -346,7 +427,7 @@ class Pet:
         self.bond_points += max(1, base)
         self._interactions_today += 1
         self.mood = _shift_mood(self.mood, 1)
-        return random.choice(_PLAY_DESCRIPTIONS[self.species])
+        return _choice(_PLAY_DESCRIPTIONS[self.species])
 
     # -- Foraging -------------------------------------------------------------
 
@@ -357,40 +438,37 @@ class Pet:
         self.energy = max(0, self.energy - 10)
         self.activity = PetActivity.FORAGING
 
-        chance = self.profile.base_forage_chance
-        # Bond level boosts foraging luck
-        if self.bond_tier in (BondTier.DEVOTED, BondTier.SOULBOUND):
+        # Species and personality bonuses
+        chance = self._base_forage_chance
+        # Bond level boosts foraging luck (devoted or soulbound)
+        if self.bond_points >= _DEVOTED_BOND_POINTS:
             chance += 0.10
         # Favourite season bonus
         if season is self.profile.favourite_season:
             chance += 0.05
-        # Curious pets forage better
-        if self.personality is PetPersonality.CURIOUS:
-            chance += 0.08
 
-        if random.random() > chance:
+        if _rand() > chance:
             return None
 
-        category = random.choice(self.profile.forage_categories)
-        item = _roll_forage_item(category)
-        if item:
-            self.found_items.append(item)
-            self.bond_points += 1
+        items, cum_weights = _choice(_SPECIES_FORAGE_POOLS[self.species])
+        if not items:
+            return None
+        item = items[bisect.bisect(cum_weights, _rand() * cum_weights[-1], 0, len(items) - 1)]
+        self.found_items.append(item)
+        self.bond_points += 1
         return item
 
     # -- Weather reactions ----------------------------------------------------
 
     def react_to_weather(self, weather: str) -> str:
         """Return a description of how the pet reacts to current weather."""
-        if weather == self.profile.disliked_weather:
-            self.mood = _shift_mood(self.mood, -1)
-            self.activity = PetActivity.SHELTERING
-            return random.choice(_WEATHER_DISLIKE[self.species])
-        if weather == self.profile.favourite_weather:
-            self.mood = _shift_mood(self.mood, 1)
-            self.activity = PetActivity.PLAYING
-            return random.choice(_WEATHER_LOVE[self.species])
-        return f"{self.name} doesn't seem bothered by the {weather}."
+        reaction = _WEATHER_REACTION[self.species].get(weather)
+        if reaction is None:
+            return f"{self.name} doesn't seem bothered by the {weather}."
+        delta, activity, templates = reaction
+        self.mood = _shift_mood(self.mood, delta)
+        self.activity = activity
+        return _choice(templates)
 
     # -- Villager interactions ------------------------------------------------
 
@@ -405,11 +483,12 @@ class Pet:
         if self.species is Species.DOG:
             base_bonus = 3  # dogs are friendship machines
         elif self.species is Species.CAT:
-            base_bonus = 1 if random.random() > 0.3 else 0  # cats are picky
-        if villager_name == self.favourite_villager:
+            base_bonus = 1 if _rand() > 0.3 else 0  # cats are picky
+        favourite = self.favourite_villager
+        if favourite is not None and villager_name == favourite:
             base_bonus += 2
 
-        desc = random.choice(_VILLAGER_GREET[self.species]).format(
+        desc = _choice(_VILLAGER_GREET[self.species]).format(
             pet=self.name, villager=villager_name,
         )
         self.bond_points += 1
@@ -429,27 +508,26 @@ class Pet:
             self.bond_points = max(0, self.bond_points - 1)
 
     def _roll_mood(self) -> None:
-        weights = _PERSONALITY_MOOD[self.personality]
-        moods = list(weights.keys())
-        probs = list(weights.values())
-        self.mood = random.choices(moods, weights=probs, k=1)[0]
+        moods, cum_weights = _PERSONALITY_MOOD_PREPARED[self.personality]
+        self.mood = moods[bisect.bisect(cum_weights, _rand() * cum_weights[-1], 0, len(moods) - 1)]
 
     # -- Display --------------------------------------------------------------
 
     def status(self) -> str:
-        tier = self.bond_tier.value
-        return (
-            f"{self.name} the {self.species.value} "
-            f"({self.personality.value}) — "
-            f"Mood: {self.mood.value}  |  "
-            f"Bond: {self.bond_points}pts ({tier})  |  "
-            f"Energy: {self.energy}/100  |  "
-            f"Items found: {len(self.found_items)}"
-        )
+        return _STATUS_FMT.format_map({
+            "name": self.name,
+            "species": self._species_name,
+            "personality": self._personality_name,
+            "mood": self.mood.value,
+            "bond": self.bond_points,
+            "tier": self.bond_tier.value,
+            "energy": self.energy,
+            "items": len(self.found_items),
+        })
 
     def __repr__(self) -> str:
         return (
-            f"Pet({self.name!r}, {self.species.value}, "
+            f"Pet({self.name!r}, {self._species_name}, "
             f"bond={self.bond_points}, mood={self.mood.value})"
         )
 
@@ -459,203 +537,176 @@ class Pet:
 # ---------------------------------------------------------------------------
 
 _MOOD_ORDER = [PetMood.LONELY, PetMood.RESTLESS, PetMood.CONTENT, PetMood.HAPPY, PetMood.ECSTATIC]
+_MOOD_RANK: dict[PetMood, int] = {mood: i for i, mood in enumerate(_MOOD_ORDER)}
+_MAX_MOOD_RANK = len(_MOOD_ORDER) - 1
 
 
 def _shift_mood(current: PetMood, delta: int) -> PetMood:
-    idx = _MOOD_ORDER.index(current)
-    new_idx = max(0, min(len(_MOOD_ORDER) - 1, idx + delta))
-    return _MOOD_ORDER[new_idx]
+    return _MOOD_ORDER[max(0, min(_MAX_MOOD_RANK, _MOOD_RANK[current] + delta))]
 
 
 # ---------------------------------------------------------------------------
 # Narrative templates
 # ---------------------------------------------------------------------------
 
-_PET_REACTIONS: dict[Species, list[str]] = {
-    Species.CAT: [
-        "{name} purrs and bumps their head against your hand.",
-        "{name} rolls over, showing a fluffy belly. (It's a trap.)",
-        "{name} slow-blinks at you — the highest cat compliment.",
-    ],
-    Species.DOG: [
-        "{name} wags their tail so hard their whole body wiggles!",
-        "{name} licks your hand and gazes up adoringly.",
-        "{name} barks once, tail going a mile a minute.",
-    ],
-    Species.RABBIT: [
-        "{name} does a little binky hop of happiness!",
-        "{name} nuzzles into your palm, nose twitching.",
-        "{name} flops onto their side — total relaxation.",
-    ],
-    Species.OWL: [
-        "{name} ruffles their feathers and hoots softly.",
-        "{name} closes their eyes and leans into the scritches.",
-        "{name} tilts their head 180 degrees, looking pleased.",
-    ],
-    Species.FOX: [
-        "{name} makes that funny chuckling sound foxes do.",
-        "{name} rolls in a patch of sunlight, belly up.",
-        "{name} nips your sleeve playfully and darts away.",
-    ],
-    Species.HEDGEHOG: [
-        "{name} uncurls and sniffs your fingers trustingly.",
-        "{name}'s little nose wiggles with delight.",
-        "{name} trundles in a happy circle around your feet.",
-    ],
-}
-
-# Format the name into the templates
-for _species, _templates in _PET_REACTIONS.items():
-    _PET_REACTIONS[_species] = [t.replace("{name}", "{self.name}") for t in _templates]
-# Revert — we'll format at call time with a different approach
-_PET_REACTIONS = {
-    Species.CAT: [
+_PET_REACTIONS: dict[Species, tuple[str, ...]] = {
+    Species.CAT: (
         "purrs and bumps their head against your hand.",
         "rolls over, showing a fluffy belly. (It's a trap.)",
         "slow-blinks at you — the highest cat compliment.",
-    ],
-    Species.DOG: [
+    ),
+    Species.DOG: (
         "wags their tail so hard their whole body wiggles!",
         "licks your hand and gazes up adoringly.",
         "barks once, tail going a mile a minute.",
-    ],
-    Species.RABBIT: [
+    ),
+    Species.RABBIT: (
         "does a little binky hop of happiness!",
         "nuzzles into your palm, nose twitching.",
         "flops onto their side — total relaxation.",
-    ],
-    Species.OWL: [
+    ),
+    Species.OWL: (
         "ruffles their feathers and hoots softly.",
         "closes their eyes and leans into the scritches.",
         "tilts their head, looking pleased.",
-    ],
-    Species.FOX: [
+    ),
+    Species.FOX: (
         "makes that funny chuckling sound foxes do.",
         "rolls in a patch of sunlight, belly up.",
         "nips your sleeve playfully and darts away.",
-    ],
-    Species.HEDGEHOG: [
+    ),
+    Species.HEDGEHOG: (
         "uncurls and sniffs your fingers trustingly.",
         "wiggles their little nose with delight.",
         "trundles in a happy circle around your feet.",
-    ],
+    ),
 }
 
-_PLAY_DESCRIPTIONS: dict[Species, list[str]] = {
-    Species.CAT: [
+_PLAY_DESCRIPTIONS: dict[Species, tuple[str, ...]] = {
+    Species.CAT: (
         "chases a dangling piece of string with laser focus.",
         "pounces on a crinkly leaf, victorious.",
         "bats a ball of yarn across the room.",
-    ],
-    Species.DOG: [
+    ),
+    Species.DOG: (
         "fetches a stick and brings it back, dripping with pride.",
         "zooms around the garden in circles — pure joy!",
         "tugs on a rope toy, tail wagging furiously.",
-    ],
-    Species.RABBIT: [
+    ),
+    Species.RABBIT: (
         "binkies through a little obstacle course!",
         "hops through a tunnel of cardboard boxes.",
         "kicks their back legs up in a joyful sprint.",
-    ],
-    Species.OWL: [
+    ),
+    Species.OWL: (
         "swoops between perches with silent grace.",
         "catches a tossed treat mid-air — impressive!",
         "plays hide-and-seek, blending perfectly with the bookshelf.",
-    ],
-    Species.FOX: [
+    ),
+    Species.FOX: (
         "pounces on a hidden squeaky toy with glee.",
         "plays keep-away, always just out of reach.",
         "digs a pretend burrow in a pile of blankets.",
-    ],
-    Species.HEDGEHOG: [
+    ),
+    Species.HEDGEHOG: (
         "explores a maze made of books and cushions.",
         "pushes a tiny ball around with their nose.",
         "splashes happily in a shallow dish of water.",
-    ],
+    ),
 }
 
-_WEATHER_LOVE: dict[Species, list[str]] = {
-    Species.CAT: [
+_WEATHER_LOVE: dict[Species, tuple[str, ...]] = {
+    Species.CAT: (
         "stretches out in a perfect sunbeam, utterly blissful.",
         "finds the warmest spot and claims it immediately.",
-    ],
-    Species.DOG: [
+    ),
+    Species.DOG: (
         "bounds through the sunshine, tongue lolling happily.",
         "rolls in the warm grass, legs in the air.",
-    ],
-    Species.RABBIT: [
+    ),
+    Species.RABBIT: (
         "hops around the sunlit garden, ears perked up.",
         "stretches out flat in a warm sunny patch.",
-    ],
-    Species.OWL: [
+    ),
+    Species.OWL: (
         "perches in the misty tree, eyes gleaming with interest.",
         "glides silently through the fog, perfectly at home.",
-    ],
-    Species.FOX: [
+    ),
+    Species.FOX: (
         "disappears into the mist and reappears with something shiny.",
         "pads silently through the fog, looking mysterious.",
-    ],
-    Species.HEDGEHOG: [
+    ),
+    Species.HEDGEHOG: (
         "trundles happily through puddles after the rain.",
         "snuffles through the damp garden, finding treasures.",
-    ],
+    ),
 }
 
-_WEATHER_DISLIKE: dict[Species, list[str]] = {
-    Species.CAT: [
+_WEATHER_DISLIKE: dict[Species, tuple[str, ...]] = {
+    Species.CAT: (
         "gives the rain a deeply offended look and retreats indoors.",
         "sits in the window, glaring at every raindrop.",
-    ],
-    Species.DOG: [
+    ),
+    Species.DOG: (
         "whimpers at the thunder and presses close to you.",
         "hides under the table until the storm passes.",
-    ],
-    Species.RABBIT: [
+    ),
+    Species.RABBIT: (
         "thumps their back leg nervously at the loud thunder.",
         "dives into their burrow and won't come out.",
-    ],
-    Species.OWL: [
+    ),
+    Species.OWL: (
         "fluffs up grumpily and hunkers down on a high shelf.",
         "tucks their head under a wing, very put out.",
-    ],
-    Species.FOX: [
+    ),
+    Species.FOX: (
         "shivers and curls up by the fire, looking small.",
         "tucks their nose under their tail and waits it out.",
-    ],
-    Species.HEDGEHOG: [
+    ),
+    Species.HEDGEHOG: (
         "rolls into a tight ball and refuses to uncurl.",
         "burrows under a blanket, only a nose visible.",
-    ],
+    ),
 }
 
-_VILLAGER_GREET: dict[Species, list[str]] = {
-    Species.CAT: [
+_VILLAGER_GREET: dict[Species, tuple[str, ...]] = {
+    Species.CAT: (
         "{pet} winds between {villager}'s ankles, purring.",
         "{pet} deigns to sniff {villager}'s offered hand.",
-    ],
-    Species.DOG: [
+    ),
+    Species.DOG: (
         "{pet} bounds up to {villager}, tail a blur of excitement!",
         "{pet} drops a stick at {villager}'s feet, hopeful.",
-    ],
-    Species.RABBIT: [
+    ),
+    Species.RABBIT: (
         "{pet} hops up to {villager} and sniffs their shoes curiously.",
         "{pet} lets {villager} gently stroke their ears.",
-    ],
-    Species.OWL: [
+    ),
+    Species.OWL: (
         "{pet} swoops down and lands on {villager}'s shoulder!",
         "{pet} hoots a dignified greeting at {villager}.",
-    ],
-    Species.FOX: [
+    ),
+    Species.FOX: (
         "{pet} approaches {villager} cautiously, then steals a snack.",
         "{pet} yips at {villager} and does a little dance.",
-    ],
-    Species.HEDGEHOG: [
+    ),
+    Species.HEDGEHOG: (
         "{pet} trundles up to {villager}'s feet, snuffling.",
         "{pet} lets {villager} carefully pick them up.",
-    ],
+    ),
 }
 
 
+# Per-species (mood delta, activity, templates) for the weathers a pet has
+# an opinion about. Disliked weather is added last so it wins any tie.
+_WEATHER_REACTION: dict[Species, dict[str, tuple[int, PetActivity, tuple[str, ...]]]] = {}
+for _species, _profile in SPECIES_PROFILES.items():
+    _WEATHER_REACTION[_species] = {
+        _profile.favourite_weather: (1, PetActivity.PLAYING, _WEATHER_LOVE[_species]),
+        _profile.disliked_weather: (-1, PetActivity.SHELTERING, _WEATHER_DISLIKE[_species]),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Pet manager — oversees all pets in the village
 # ---------------------------------------------------------------------------
@@ -697,39 +748,47 @@ class PetManager:
         """Advance one day for all pets. Returns narrative events."""
         self.day += 1
         events: list[str] = []
+        # Only pets that pass the greeting roll pick a villager, so the
+        # per-day villager draws scale with hits rather than pet count.
+        can_greet = bool(villager_names)
+        # Local bindings for the loop below
+        add_event = events.append
+        sheltering = PetActivity.SHELTERING
+        weather_reaction = _WEATHER_REACTION
+        rand = _rand
 
         for pet in self.pets.values():
             pet.start_new_day()
+            name = pet.name
 
             # Weather reaction
             reaction = pet.react_to_weather(weather)
-            if weather in (pet.profile.favourite_weather, pet.profile.disliked_weather):
-                events.append(f"{pet.name} {reaction}")
+            if weather in weather_reaction[pet.species]:
+                add_event(f"{name} {reaction}")
 
             # Foraging attempt (if not sheltering)
-            if pet.activity is not PetActivity.SHELTERING:
+            if pet.activity is not sheltering:
                 item = pet.forage(season)
                 if item:
-                    events.append(
-                        f"{pet.name} found a {item.name}! ({item.rarity}) "
+                    add_event(
+                        f"{name} found a {item.name}! ({item.rarity.label}) "
                         f"— {item.description}"
                     )
 
             # Villager greeting (random chance)
-            if villager_names and random.random() < 0.3:
-                villager = random.choice(villager_names)
-                desc, bonus = pet.greet_villager(villager)
-                events.append(desc)
+            if can_greet and rand() < 0.3:
+                desc, _ = pet.greet_villager(_choice(villager_names))
+                add_event(desc)
 
         return events
 
     def all_found_items(self) -> list[tuple[str, FoundItem]]:
         """Return all items found by all pets as (pet_name, item) pairs."""
-        result = []
-        for pet in self.pets.values():
-            for item in pet.found_items:
-                result.append((pet.name, item))
-        return result
+        return [
+            (pet.name, item)
+            for pet in self.pets.values()
+            for item in pet.found_items
+        ]
 
     def status_report(self) -> str:
         """Return a summary of all pets."""
@@ -789,7 +848,7 @@ def _demo() -> None:
 
     print("\nItems found:")
     for pet_name, item in manager.all_found_items():
-        print(f"  {pet_name} found: {item.name} ({item.rarity}) — {item.description}")
+        print(f"  {pet_name} found: {item.name} ({item.rarity.label}) — {item.description}")
 
 
 if __name__ == "__main__":
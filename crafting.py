@@ -16,25 +16,32 @@ Features:
 
 from __future__ import annotations
 
+import bisect
 import math
 import random
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Optional
+from enum import Enum, IntEnum, IntFlag, auto
+from typing import ClassVar, NamedTuple, Optional
+
+# Bound once to skip the module attribute lookup per craft. This is the
+# shared generator's method, so random.seed() still governs it.
+_rand = random.random
 
 
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
 
-class Season(Enum):
-    SPRING = auto()
-    SUMMER = auto()
-    AUTUMN = auto()
-    WINTER = auto()
+class Season(IntFlag):
+    """Seasons as bit flags, so a set of seasons packs into one int mask."""
+
+    SPRING = 1
+    SUMMER = 2
+    AUTUMN = 4
+    WINTER = 8
 
 
-class MaterialRarity(Enum):
+class MaterialRarity(IntEnum):
     COMMON = 1
     UNCOMMON = 2
     RARE = 3
@@ -42,7 +49,7 @@ class MaterialRarity(Enum):
 
     @property
     def quality_bonus(self) -> float:
-        return {1: 0.0, 2: 0.05, 3: 0.12, 4: 0.25}[self.value]
+        return _RARITY_QUALITY_BONUS[self]
 
 
 class ItemCategory(Enum):
@@ -69,20 +76,39 @@ class QualityTier(Enum):
 
     @property
     def comfort_multiplier(self) -> float:
-        return {
-            "Rough": 0.6,
-            "Standard": 1.0,
-            "Fine": 1.3,
-            "Masterwork": 1.6,
-            "Legendary": 2.0,
-        }[self.value]
+        return _COMFORT_MULTIPLIER[self]
+
+
+_RARITY_QUALITY_BONUS: dict[MaterialRarity, float] = {
+    MaterialRarity.COMMON: 0.0,
+    MaterialRarity.UNCOMMON: 0.05,
+    MaterialRarity.RARE: 0.12,
+    MaterialRarity.LEGENDARY: 0.25,
+}
+
+_COMFORT_MULTIPLIER: dict[QualityTier, float] = {
+    QualityTier.ROUGH: 0.6,
+    QualityTier.STANDARD: 1.0,
+    QualityTier.FINE: 1.3,
+    QualityTier.MASTERWORK: 1.6,
+    QualityTier.LEGENDARY: 2.0,
+}
+
+# Craft-time reduction granted by a tool of each quality.
+_TOOL_SPEED_BONUS: dict[QualityTier, float] = {
+    QualityTier.ROUGH: -0.10,
+    QualityTier.STANDARD: 0.0,
+    QualityTier.FINE: 0.10,
+    QualityTier.MASTERWORK: 0.20,
+    QualityTier.LEGENDARY: 0.35,
+}
 
 
 # ---------------------------------------------------------------------------
 # Core data classes
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Material:
     """A gatherable resource used in crafting."""
 
@@ -92,20 +118,26 @@ class Material:
         Season.SPRING, Season.SUMMER, Season.AUTUMN, Season.WINTER,
     )
     description: str = ""
+    seasons_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        mask = 0
+        for season in self.seasons:
+            mask |= season
+        object.__setattr__(self, "seasons_mask", mask)
 
     def available_in(self, season: Season) -> bool:
-        return season in self.seasons
+        return bool(self.seasons_mask & season)
 
 
-@dataclass(frozen=True)
-class RecipeIngredient:
+class RecipeIngredient(NamedTuple):
     """One ingredient line inside a recipe."""
 
     material: Material
     quantity: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recipe:
     """A blueprint for crafting an item."""
 
@@ -119,12 +151,41 @@ class Recipe:
     description: str = ""
     unlocked_by_default: bool = True
 
-    @property
-    def total_material_count(self) -> int:
-        return sum(ing.quantity for ing in self.ingredients)
+    # Derived from ingredients once in __post_init__
+    total_material_count: int = field(init=False, repr=False, compare=False)
+    _ingredient_pairs: tuple[tuple[str, int], ...] = field(
+        init=False, repr=False, compare=False,
+    )
+    _is_furniture: bool = field(init=False, repr=False, compare=False)
+    _base_xp: int = field(init=False, repr=False, compare=False)
+    _rarity_avg: float = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "total_material_count",
+            sum(quantity for _, quantity in self.ingredients),
+        )
+        object.__setattr__(
+            self, "_ingredient_pairs",
+            tuple((material.name, quantity) for material, quantity in self.ingredients),
+        )
+        object.__setattr__(
+            self, "_is_furniture", self.category is ItemCategory.FURNITURE,
+        )
+        # XP before the crafter's level multiplier is applied
+        object.__setattr__(
+            self, "_base_xp",
+            10 * self.total_material_count + 5 * self.skill_requirement,
+        )
+        # Mean ingredient rarity bonus, added to every quality roll
+        object.__setattr__(
+            self, "_rarity_avg",
+            sum(_RARITY_QUALITY_BONUS[material.rarity] for material, _ in self.ingredients)
+            / max(len(self.ingredients), 1),
+        )
 
-@dataclass
+
+@dataclass(eq=False, slots=True)
 class CraftedItem:
     """An item produced by crafting."""
 
@@ -134,8 +195,8 @@ class CraftedItem:
     comfort: float = 0.0
 
     def __post_init__(self) -> None:
-        if self.recipe.category == ItemCategory.FURNITURE:
-            self.comfort = self.recipe.comfort_score * self.quality.comfort_multiplier
+        if self.recipe._is_furniture:
+            self.comfort = self.recipe.comfort_score * _COMFORT_MULTIPLIER[self.quality]
 
     @property
     def display_name(self) -> str:
@@ -146,16 +207,10 @@ class CraftedItem:
         """Tools crafted at higher quality let the crafter work faster."""
         if self.recipe.category != ItemCategory.TOOL:
             return 0.0
-        return {
-            QualityTier.ROUGH: -0.10,
-            QualityTier.STANDARD: 0.0,
-            QualityTier.FINE: 0.10,
-            QualityTier.MASTERWORK: 0.20,
-            QualityTier.LEGENDARY: 0.35,
-        }[self.quality]
+        return _TOOL_SPEED_BONUS[self.quality]
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Inventory:
     """Simple quantity-tracked inventory of materials and crafted items."""
 
@@ -167,29 +222,58 @@ class Inventory:
     def add_material(self, material: Material, quantity: int = 1) -> None:
         if quantity <= 0:
             raise ValueError("Quantity must be positive.")
-        self._materials[material.name] = (
-            self._materials.get(material.name, 0) + quantity
-        )
+        name = material.name
+        self._materials[name] = self._materials.get(name, 0) + quantity
 
     def remove_material(self, material: Material, quantity: int = 1) -> None:
-        current = self._materials.get(material.name, 0)
+        name = material.name
+        current = self._materials.get(name, 0)
         if current < quantity:
-            raise InsufficientMaterialError(material.name, quantity, current)
-        self._materials[material.name] = current - quantity
-        if self._materials[material.name] == 0:
-            del self._materials[material.name]
+            raise InsufficientMaterialError(name, quantity, current)
+        remaining = current - quantity
+        if remaining:
+            self._materials[name] = remaining
+        else:
+            del self._materials[name]
 
     def material_count(self, material: Material) -> int:
         return self._materials.get(material.name, 0)
 
     def has_materials_for(self, recipe: Recipe) -> bool:
+        materials = self._materials
         return all(
-            self.material_count(ing.material) >= ing.quantity
-            for ing in recipe.ingredients
+            materials.get(name, 0) >= quantity
+            for name, quantity in recipe._ingredient_pairs
         )
 
+    def consume_materials_for(
+        self, recipe: Recipe, *, consume: bool = True,
+    ) -> list[str]:
+        """Check a recipe's materials and take them in one pass.
+
+        Returns a message per missing ingredient.  Materials are only
+        removed when nothing is missing and *consume* is true.
+        """
+        materials = self._materials
+        shortfalls: list[str] = []
+        remaining: dict[str, int] = {}
+        for name, quantity in recipe._ingredient_pairs:
+            have = remaining.get(name, materials.get(name, 0))
+            if have < quantity:
+                shortfalls.append(f"Need {quantity}x {name} (have {have}).")
+            else:
+                remaining[name] = have - quantity
+        if consume and not shortfalls:
+            for name, left in remaining.items():
+                if left:
+                    materials[name] = left
+                else:
+                    del materials[name]
+        return shortfalls
+
     @property
     def material_summary(self) -> dict[str, int]:
+        """Snapshot of material counts keyed by name."""
         return dict(self._materials)
 
     # -- crafted items --
@@ -203,14 +287,14 @@ class Inventory:
 
     @property
     def total_comfort(self) -> float:
-        return sum(item.comfort for item in self._items)
+        return sum(i.comfort for i in self._items)
 
 
 # ---------------------------------------------------------------------------
 # Crafter (the player / villager doing the crafting)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Crafter:
     """A villager who can gather materials and craft items."""
 
@@ -221,8 +305,8 @@ class Crafter:
     known_recipes: set[str] = field(default_factory=set)
     equipped_tool: Optional[CraftedItem] = None
 
-    _XP_PER_LEVEL: int = field(default=100, init=False, repr=False)
-    _MAX_LEVEL: int = field(default=50, init=False, repr=False)
+    _XP_PER_LEVEL: ClassVar[int] = 100
+    _MAX_LEVEL: ClassVar[int] = 50
 
     # -- experience & leveling --
 
@@ -230,11 +314,11 @@ class Crafter:
         """Award XP and return a list of messages (e.g. level-ups)."""
         messages: list[str] = []
         self.experience += amount
-        while (
-            self.experience >= self._xp_for_next_level
-            and self.skill_level < self._MAX_LEVEL
-        ):
-            self.experience -= self._xp_for_next_level
+        while self.skill_level < self._MAX_LEVEL:
+            needed = self._xp_for_next_level
+            if self.experience < needed:
+                break
+            self.experience -= needed
             self.skill_level += 1
             messages.append(
                 f"{self.name} reached crafting level {self.skill_level}!"
@@ -243,7 +327,10 @@ class Crafter:
 
     @property
     def _xp_for_next_level(self) -> int:
-        return int(self._XP_PER_LEVEL * (1 + 0.15 * (self.skill_level - 1)))
+        level = self.skill_level
+        if 1 <= level <= len(_XP_FOR_LEVEL):
+            return _XP_FOR_LEVEL[level - 1]
+        return int(self._XP_PER_LEVEL * (1 + 0.15 * (level - 1)))
 
     # -- recipe knowledge --
 
@@ -280,10 +367,37 @@ class Crafter:
         )
 
 
+# XP needed to advance from each level (index 0 is level 1)
+_XP_FOR_LEVEL: tuple[int, ...] = tuple(
+    int(Crafter._XP_PER_LEVEL * (1 + 0.15 * (level - 1)))
+    for level in range(1, Crafter._MAX_LEVEL + 1)
+)
+
+
 # ---------------------------------------------------------------------------
 # Crafting engine
 # ---------------------------------------------------------------------------
 
+# Minimum score for each tier above ROUGH, in ascending order.
+_QUALITY_THRESHOLDS: tuple[float, ...] = (0.35, 0.55, 0.75, 0.92)
+_QUALITY_TIERS: tuple[QualityTier, ...] = (
+    QualityTier.ROUGH,
+    QualityTier.STANDARD,
+    QualityTier.FINE,
+    QualityTier.MASTERWORK,
+    QualityTier.LEGENDARY,
+)
+
+# How much an equipped tool's quality shifts the quality score.
+_TOOL_QUALITY_BONUS: dict[QualityTier, float] = {
+    QualityTier.ROUGH: -0.05,
+    QualityTier.STANDARD: 0.0,
+    QualityTier.FINE: 0.03,
+    QualityTier.MASTERWORK: 0.07,
+    QualityTier.LEGENDARY: 0.12,
+}
+
+
 def _compute_quality(crafter: Crafter, recipe: Recipe) -> QualityTier:
     """Determine the quality tier of a crafted item.
 
@@ -293,34 +407,15 @@ def _compute_quality(crafter: Crafter, recipe: Recipe) -> QualityTier:
     skill_delta = crafter.skill_level - recipe.skill_requirement
     base_score = 0.30 + 0.012 * max(skill_delta, 0)
 
-    rarity_avg = (
-        sum(ing.material.rarity.quality_bonus for ing in recipe.ingredients)
-        / max(len(recipe.ingredients), 1)
-    )
-    base_score += rarity_avg
+    base_score += recipe._rarity_avg
 
     if crafter.equipped_tool:
-        tool_quality_bonus = {
-            QualityTier.ROUGH: -0.05,
-            QualityTier.STANDARD: 0.0,
-            QualityTier.FINE: 0.03,
-            QualityTier.MASTERWORK: 0.07,
-            QualityTier.LEGENDARY: 0.12,
-        }[crafter.equipped_tool.quality]
-        base_score += tool_quality_bonus
-
-    roll = random.random() * 0.20
+        base_score += _TOOL_QUALITY_BONUS[crafter.equipped_tool.quality]
+
+    roll = _rand() * 0.20
     final = min(base_score + roll, 1.0)
 
-    if final >= 0.92:
-        return QualityTier.LEGENDARY
-    if final >= 0.75:
-        return QualityTier.MASTERWORK
-    if final >= 0.55:
-        return QualityTier.FINE
-    if final >= 0.35:
-        return QualityTier.STANDARD
-    return QualityTier.ROUGH
+    return _QUALITY_TIERS[bisect.bisect_right(_QUALITY_THRESHOLDS, final)]
 
 
 def craft(
@@ -353,27 +448,20 @@ def craft(
         )
 
     if season is not None:
-        for ing in recipe.ingredients:
-            if not ing.material.available_in(season):
+        for material, _ in recipe.ingredients:
+            if not material.available_in(season):
                 errors.append(
-                    f"{ing.material.name} is not available in {season.name}."
+                    f"{material.name} is not available in {season.name}."
                 )
 
-    if not crafter.inventory.has_materials_for(recipe):
-        for ing in recipe.ingredients:
-            have = crafter.inventory.material_count(ing.material)
-            if have < ing.quantity:
-                errors.append(
-                    f"Need {ing.quantity}x {ing.material.name} (have {have})."
-                )
+    # Check materials and, if nothing else failed, consume them in one pass
+    errors.extend(
+        crafter.inventory.consume_materials_for(recipe, consume=not errors)
+    )
 
     if errors:
         return CraftResult(success=False, errors=tuple(errors))
 
-    # Consume materials
-    for ing in recipe.ingredients:
-        crafter.inventory.remove_material(ing.material, ing.quantity)
-
     # Determine quality
     quality = _compute_quality(crafter, recipe)
     item = CraftedItem(
@@ -381,16 +469,12 @@ def craft(
     )
 
     # Calculate craft time
-    speed_bonus = (
-        crafter.equipped_tool.tool_speed_bonus
-        if crafter.equipped_tool
-        else 0.0
-    )
+    tool = crafter.equipped_tool
+    speed_bonus = tool.tool_speed_bonus if tool else 0.0
     craft_time = recipe.base_craft_time * (1.0 - speed_bonus)
 
     # Award XP
-    base_xp = 10 * recipe.total_material_count + 5 * recipe.skill_requirement
-    xp = max(int(base_xp * (1 + 0.05 * crafter.skill_level)), 1)
+    xp = max(int(recipe._base_xp * (1 + 0.05 * crafter.skill_level)), 1)
     level_messages = crafter.gain_experience(xp)
 
     crafter.inventory.add_item(item)
@@ -404,7 +488,7 @@ def craft(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CraftResult:
     """Outcome of a crafting attempt."""
 
@@ -442,14 +526,20 @@ def calculate_village_happiness(
     Happiness scales with total comfort but has diminishing returns per
     villager so that larger villages need proportionally more furniture.
     """
-    total_comfort = sum(item.comfort for item in placed_furniture)
+    # One pass gathers both the comfort total and the distinct furniture types
+    total_comfort = 0.0
+    recipe_names: set[str] = set()
+    add_name = recipe_names.add
+    for item in placed_furniture:
+        total_comfort += item.comfort
+        add_name(item.recipe.name)
     per_capita = total_comfort / max(villager_count, 1)
 
     # Diminishing returns: comfort → happiness via log curve
     raw = 20.0 * math.log1p(per_capita)
     happiness = min(round(raw, 1), 100.0)
 
-    unique_types = len({item.recipe.name for item in placed_furniture})
+    unique_types = len(recipe_names)
     variety_bonus = min(unique_types * 2.0, 20.0)
     happiness = min(happiness + variety_bonus, 100.0)
 
@@ -462,7 +552,7 @@ def calculate_village_happiness(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VillageHappiness:
     total_comfort: float
     per_capita_comfort: float
@@ -856,26 +946,65 @@ class SeasonRestrictionError(CraftingError):
 # Convenience helpers
 # ---------------------------------------------------------------------------
 
+def _recipe_book_entry(recipe: Recipe) -> str:
+    """Format one recipe's block, including its trailing blank line."""
+    lock = "" if recipe.unlocked_by_default else " [locked]"
+    comfort = (
+        f"    Base comfort: {recipe.comfort_score}\n" if recipe.comfort_score else ""
+    )
+    materials = ", ".join(
+        f"{quantity}x {material.name}" for material, quantity in recipe.ingredients
+    )
+    return (
+        f"  {recipe.name}{lock}  ({recipe.category.name})\n"
+        f"    {recipe.description}\n"
+        f"    Station: {recipe.workstation.value}\n"
+        f"    Skill req: {recipe.skill_requirement}\n"
+        f"{comfort}"
+        f"    Materials: {materials}\n"
+    )
+
+
 def recipe_book_display(recipes: tuple[Recipe, ...] = ALL_RECIPES) -> str:
     """Return a formatted string listing all recipes for display."""
-    lines: list[str] = ["=== Recipe Book ===", ""]
-    for recipe in recipes:
-        lock = "" if recipe.unlocked_by_default else " [locked]"
-        lines.append(f"  {recipe.name}{lock}  ({recipe.category.name})")
-        lines.append(f"    {recipe.description}")
-        lines.append(f"    Station: {recipe.workstation.value}")
-        lines.append(f"    Skill req: {recipe.skill_requirement}")
-        if recipe.comfort_score:
-            lines.append(f"    Base comfort: {recipe.comfort_score}")
-        ing_parts = [
-            f"{ing.quantity}x {ing.material.name}"
-            for ing in recipe.ingredients
-        ]
-        lines.append(f"    Materials: {', '.join(ing_parts)}")
-        lines.append("")
-    return "\n".join(lines)
+    return "\n".join(
+        ["=== Recipe Book ===", "", *map(_recipe_book_entry, recipes)]
+    )
 
 
 def seasonal_materials(season: Season) -> list[Material]:
-    """Return materials available in the given season."""
-    return [m for m in ALL_MATERIALS if m.available_in(season)]
+    """Return materials available in the given season.
+
+    A combined flag such as ``Season.SPRING | Season.SUMMER`` matches
+    materials available in any of its seasons.
+    """
+    materials = _MATERIALS_BY_SEASON.get(season)
+    if materials is None:
+        return [m for m in ALL_MATERIALS if m.seasons_mask & season]
+    return list(materials)
+
+
+def recipes_for_workstation(workstation: Workstation) -> tuple[Recipe, ...]:
+    """Return the default recipes crafted at the given workstation."""
+    return _RECIPES_BY_WORKSTATION.get(workstation, ())
+
+
+def recipes_using(material: Material) -> tuple[Recipe, ...]:
+    """Return the default recipes that call for the given material."""
+    return _RECIPES_BY_MATERIAL.get(material.name, ())
+
+
+# Lookup indexes over the default recipe book, built once at import.
+_MATERIALS_BY_SEASON: dict[Season, tuple[Material, ...]] = {
+    season: tuple(m for m in ALL_MATERIALS if m.seasons_mask & season)
+    for season in Season
+}
+
+_RECIPES_BY_WORKSTATION: dict[Workstation, tuple[Recipe, ...]] = {}
+_RECIPES_BY_MATERIAL: dict[str, tuple[Recipe, ...]] = {}
+for _recipe in ALL_RECIPES:
+    _RECIPES_BY_WORKSTATION[_recipe.workstation] = (
+        _RECIPES_BY_WORKSTATION.get(_recipe.workstation, ()) + (_recipe,)
+    )
+    for _name in dict.fromkeys(material.name for material, _ in _recipe.ingredients):
+        _RECIPES_BY_MATERIAL[_name] = _RECIPES_BY_MATERIAL.get(_name, ()) + (_recipe,)
@@ -10,9 +10,18 @@ from __future__ import annotations
 
 import math
 import random
+from collections import deque
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Optional
+from enum import Enum, IntEnum, auto
+from typing import Iterable, Optional
+
+# Bound once; ``random.seed()`` still governs every draw.
+_rand = random.random
+
+# Price noise is drawn from [0.85, 1.15), written out as random.uniform
+# computes it so the values stay identical without the extra call.
+_NOISE_LOW = 0.85
+_NOISE_SPAN = 1.15 - 0.85
 
 
 # ---------------------------------------------------------------------------
@@ -26,9 +35,13 @@ class Season(Enum):
     WINTER = auto()
 
     def next(self) -> "Season":
-        members = list(Season)
-        idx = (members.index(self) + 1) % len(members)
-        return members[idx]
+        return _NEXT_SEASON[self]
+
+
+_SEASON_ORDER = tuple(Season)
+_NEXT_SEASON: dict[Season, Season] = dict(
+    zip(_SEASON_ORDER, _SEASON_ORDER[1:] + _SEASON_ORDER[:1])
+)
 
 
 class ItemCategory(Enum):
@@ -36,11 +49,18 @@ class ItemCategory(Enum):
     POTION = "potion"
 
 
+class MarketEvent(IntEnum):
+    """Kinds of raw event produced by Market.tick (see Market.format_event)."""
+    SEASON_CHANGE = 1  # payload: (old season, new season)
+    SPOILED = 2  # payload: (villager name, item key)
+    PRICE_SHIFT = 3  # no payload
+
+
 # ---------------------------------------------------------------------------
 # Items & recipes
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Item:
     name: str
     category: ItemCategory
@@ -53,18 +73,27 @@ class Item:
         return round(self.base_price * multiplier, 2)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ingredient:
     name: str
     base_cost: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recipe:
     output: Item
     ingredients: dict[str, int]  # ingredient name -> quantity
     craft_time: int  # minutes
     skill_required: float  # 0.0 – 1.0
+    # (name, quantity) pairs, iterated by the crafting checks
+    _ingredient_pairs: tuple[tuple[str, int], ...] = field(
+        init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_ingredient_pairs", tuple(self.ingredients.items()),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -183,12 +212,40 @@ RECIPES: dict[str, Recipe] = {
     ),
 }
 
+_ITEM_KEYS: tuple[str, ...] = tuple(ITEMS)
+
+# Keys of the items that can spoil; potions never do.
+_PERISHABLE_KEYS: frozenset[str] = frozenset(
+    key for key, item in ITEMS.items() if item.shelf_life > 0
+)
+
+# Seasonal price of every item, rounded exactly as Item.price_in_season.
+_SEASONAL_PRICE: dict[Season, dict[str, float]] = {
+    season: {key: item.price_in_season(season) for key, item in ITEMS.items()}
+    for season in Season
+}
+
+# The fixed columns of each price board row; price and season are filled in
+# per call.  Key order is the board's column order.
+_BOARD_TEMPLATES: dict[str, dict] = {
+    key: {
+        "key": key,
+        "name": item.name,
+        "category": item.category.value,
+        "price": None,
+        "base_price": item.base_price,
+        "season": None,
+        "shelf_life": item.shelf_life or "infinite",
+    }
+    for key, item in ITEMS.items()
+}
+
 
 # ---------------------------------------------------------------------------
 # Inventory slot (tracks age for spoilage)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class InventorySlot:
     item: Item
     quantity: int
@@ -196,7 +253,8 @@ class InventorySlot:
 
     @property
     def is_spoiled(self) -> bool:
-        return self.item.shelf_life > 0 and self.age_days >= self.item.shelf_life
+        shelf_life = self.item.shelf_life
+        return shelf_life > 0 and self.age_days >= shelf_life
 
     def advance_day(self) -> None:
         self.age_days += 1
@@ -207,6 +265,11 @@ class InventorySlot:
 # ---------------------------------------------------------------------------
 
 class Villager:
+    __slots__ = (
+        "name", "coins_cents", "baking_skill", "brewing_skill",
+        "inventory", "ingredients", "reputation", "trades_completed",
+    )
+
     def __init__(
         self,
         name: str,
@@ -215,7 +278,7 @@ class Villager:
         brewing_skill: float = 0.3,
     ) -> None:
         self.name = name
-        self.coins = round(coins, 2)
+        self.coins_cents: int = round(coins * 100)  # exact integer ledger
         self.baking_skill = max(0.0, min(1.0, baking_skill))
         self.brewing_skill = max(0.0, min(1.0, brewing_skill))
         self.inventory: dict[str, InventorySlot] = {}
@@ -223,12 +286,21 @@ class Villager:
         self.reputation: float = 0.0
         self.trades_completed: int = 0
 
+    @property
+    def coins(self) -> float:
+        return self.coins_cents / 100
+
+    @coins.setter
+    def coins(self, value: float) -> None:
+        self.coins_cents = round(value * 100)
+
     # --- inventory helpers ---------------------------------------------------
 
     def add_item(self, item_key: str, quantity: int = 1, age_days: int = 0) -> None:
         if item_key in self.inventory:
             slot = self.inventory[item_key]
-            slot.age_days = max(slot.age_days, age_days)
+            if age_days > slot.age_days:
+                slot.age_days = age_days
             slot.quantity += quantity
         else:
             self.inventory[item_key] = InventorySlot(ITEMS[item_key], quantity, age_days)
@@ -245,6 +317,22 @@ class Villager:
     def add_ingredient(self, name: str, quantity: int = 1) -> None:
         self.ingredients[name] = self.ingredients.get(name, 0) + quantity
 
+    def age_inventory(self) -> list[str]:
+        """Age every slot by a day and discard the ones that spoiled.
+
+        Returns the keys of the discarded items.
+        """
+        spoiled = []
+        for key, slot in self.inventory.items():
+            slot.advance_day()
+            if key not in _PERISHABLE_KEYS:
+                continue
+            if slot.is_spoiled:
+                spoiled.append(key)
+        for key in spoiled:
+            del self.inventory[key]
+        return spoiled
+
     def remove_spoiled(self) -> list[str]:
         spoiled = [k for k, s in self.inventory.items() if s.is_spoiled]
         for k in spoiled:
@@ -264,8 +352,9 @@ class Villager:
             return False
         if self._skill_for(recipe) < recipe.skill_required:
             return False
-        for ing_name, qty in recipe.ingredients.items():
-            if self.ingredients.get(ing_name, 0) < qty:
+        have = self.ingredients
+        for ing_name, qty in recipe._ingredient_pairs:
+            if have.get(ing_name, 0) < qty:
                 return False
         return True
 
@@ -280,14 +369,18 @@ class Villager:
                 f"{self.name} lacks skill ({skill:.0%} < "
                 f"{recipe.skill_required:.0%}) for {recipe.output.name}"
             )
-        for ing_name, qty in recipe.ingredients.items():
-            if self.ingredients.get(ing_name, 0) < qty:
+        have = self.ingredients
+        pairs = recipe._ingredient_pairs
+        for ing_name, qty in pairs:
+            if have.get(ing_name, 0) < qty:
                 return f"Not enough {ing_name} (need {qty})"
         # consume ingredients
-        for ing_name, qty in recipe.ingredients.items():
-            self.ingredients[ing_name] -= qty
-            if self.ingredients[ing_name] == 0:
-                del self.ingredients[ing_name]
+        for ing_name, qty in pairs:
+            left = have[ing_name] - qty
+            if left:
+                have[ing_name] = left
+            else:
+                del have[ing_name]
         # bonus yield for high skill
         bonus = 1 + int(skill >= 0.9)
         self.add_item(recipe_key, bonus)
@@ -311,7 +404,7 @@ class Villager:
 # Trade result
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeResult:
     success: bool
     message: str
@@ -329,72 +422,138 @@ class TradeResult:
 class Market:
     """The village market where villagers trade goods."""
 
+    __slots__ = (
+        "_season", "_season_prices", "_day", "_next_season_day",
+        "_next_noise_day", "price_noise", "trade_log",
+        "_trade_count", "_volume", "_coins_exchanged_cents",
+    )
+
     TAX_RATE = 0.05  # 5 % market tax on every sale
     REPUTATION_DISCOUNT_CAP = 0.15  # max 15 % discount from reputation
+    REP_DISCOUNT_SCALE = 0.01  # buyer discount per reputation point
+    REP_TAX_SCALE = 0.08  # seller tax relief per reputation point
+    REP_TAX_CAP = 0.80  # max 80 % tax relief from reputation
 
-    def __init__(self, season: Season = Season.SPRING) -> None:
+    def __init__(
+        self,
+        season: Season = Season.SPRING,
+        log_capacity: Optional[int] = None,
+    ) -> None:
         self.season = season
-        self.day: int = 1
+        self.day = 1
         self.price_noise: dict[str, float] = {}  # per-item supply/demand jitter
-        self.trade_log: list[TradeResult] = []
+        # log_capacity keeps only the most recent trades (0 keeps none)
+        self.trade_log: list[TradeResult] | deque[TradeResult] = (
+            [] if log_capacity is None else deque(maxlen=log_capacity)
+        )
+        # running totals over successful trades, so summaries skip the log
+        self._trade_count = 0
+        self._volume: dict[str, int] = {}
+        self._coins_exchanged_cents = 0
         self._refresh_noise()
 
     # --- season / day --------------------------------------------------------
 
-    def advance_day(self, villagers: list[Villager]) -> list[str]:
+    @property
+    def season(self) -> Season:
+        return self._season
+
+    @season.setter
+    def season(self, value: Season) -> None:
+        # resolve the season's price row here so pricing never hashes the enum
+        self._season = value
+        self._season_prices = _SEASONAL_PRICE[value]
+
+    @property
+    def day(self) -> int:
+        return self._day
+
+    @day.setter
+    def day(self, value: int) -> None:
+        # schedule the next season change (day % 28 == 1) and noise shift
+        # (day % 7 == 0) so advance_day compares instead of dividing
+        self._day = value
+        # (day 1 itself never changes season, so clamp to it)
+        self._next_season_day = (max(value, 1) - 1) // 28 * 28 + 29
+        self._next_noise_day = (value // 7 + 1) * 7
+
+    def advance_day(self, villagers: Iterable[Villager]) -> list[str]:
         """Tick one day forward. Returns list of notable events."""
-        events: list[str] = []
-        self.day += 1
+        format_event = self.format_event
+        return [format_event(e) for e in self.tick(villagers)]
+
+    def tick(self, villagers: Iterable[Villager]) -> list[tuple]:
+        """Tick one day forward, returning raw ``(MarketEvent, *payload)``
+        tuples. Cheaper than advance_day when the text isn't needed."""
+        events: list[tuple] = []
+        self._day += 1
+        day = self._day
 
         # season changes every 28 days
-        if self.day % 28 == 1 and self.day > 1:
+        if day == self._next_season_day:
+            self._next_season_day += 28
             old = self.season
-            self.season = self.season.next()
-            events.append(f"Season changed from {old.name} to {self.season.name}!")
+            self.season = old.next()
+            events.append((MarketEvent.SEASON_CHANGE, old, self.season))
             self._refresh_noise()
 
         # age inventories & remove spoiled items
         for v in villagers:
-            for slot in v.inventory.values():
-                slot.advance_day()
-            spoiled = v.remove_spoiled()
-            for key in spoiled:
-                events.append(
-                    f"{v.name}'s {ITEMS[key].name} spoiled and was discarded."
-                )
+            for key in v.age_inventory():
+                events.append((MarketEvent.SPOILED, v.name, key))
 
         # minor price fluctuations every 7 days
-        if self.day % 7 == 0:
+        if day == self._next_noise_day:
+            self._next_noise_day += 7
             self._refresh_noise()
-            events.append("Market prices shifted with supply and demand.")
+            events.append((MarketEvent.PRICE_SHIFT,))
 
         return events
 
+    @staticmethod
+    def format_event(event: tuple) -> str:
+        """Render a raw tick event as display text."""
+        kind = event[0]
+        if kind is MarketEvent.SPOILED:
+            return f"{event[1]}'s {ITEMS[event[2]].name} spoiled and was discarded."
+        if kind is MarketEvent.SEASON_CHANGE:
+            return f"Season changed from {event[1].name} to {event[2].name}!"
+        return "Market prices shifted with supply and demand."
+
     def _refresh_noise(self) -> None:
-        for key in ITEMS:
-            self.price_noise[key] = random.uniform(0.85, 1.15)
+        self.price_noise = {
+            key: _NOISE_LOW + _NOISE_SPAN * _rand() for key in _ITEM_KEYS
+        }
 
     # --- pricing -------------------------------------------------------------
 
+    def _discount(self, buyer: Villager) -> float:
+        """Fractional price discount earned by the buyer's reputation."""
+        discount = buyer.reputation * self.REP_DISCOUNT_SCALE
+        if discount > self.REPUTATION_DISCOUNT_CAP:
+            return self.REPUTATION_DISCOUNT_CAP
+        return discount
+
+    def _effective_tax(self, seller: Villager) -> float:
+        """Market tax after the seller's reputation relief."""
+        relief = seller.reputation * self.REP_TAX_SCALE
+        if relief > self.REP_TAX_CAP:
+            relief = self.REP_TAX_CAP
+        return self.TAX_RATE * (1 - relief)
+
     def current_price(self, item_key: str) -> float:
-        item = ITEMS[item_key]
-        seasonal = item.price_in_season(self.season)
-        noise = self.price_noise.get(item_key, 1.0)
-        return round(seasonal * noise, 2)
+        seasonal = self._season_prices[item_key]
+        return round(seasonal * self.price_noise.get(item_key, 1.0), 2)
 
     def sell_price(self, item_key: str, seller: Villager) -> float:
         """Estimated per-unit revenue after tax. Seller reputation reduces
         the effective tax rate (up to 80% reduction at max reputation)."""
         base = self.current_price(item_key)
-        rep_tax_relief = min(seller.reputation * 0.08, 0.80)
-        effective_tax = self.TAX_RATE * (1 - rep_tax_relief)
-        return round(base * (1 - effective_tax), 2)
+        return round(base * (1 - self._effective_tax(seller)), 2)
 
     def buy_price(self, item_key: str, buyer: Villager) -> float:
         """Price a buyer pays (reputation gives a discount)."""
-        base = self.current_price(item_key)
-        rep_discount = min(buyer.reputation * 0.01, self.REPUTATION_DISCOUNT_CAP)
-        return round(base * (1 - rep_discount), 2)
+        return round(self.current_price(item_key) * (1 - self._discount(buyer)), 2)
 
     # --- trading -------------------------------------------------------------
 
@@ -425,10 +584,14 @@ class Market:
                 seller.name, item.name, quantity, 0,
             )
 
-        unit_price = self.buy_price(item_key, buyer)
-        total = round(unit_price * quantity, 2)
+        # same unit price as buy_price, from a single current_price call
+        unit_price = round(
+            self.current_price(item_key) * (1 - self._discount(buyer)), 2,
+        )
+        total_cents = round(unit_price * 100) * quantity
+        total = total_cents / 100
 
-        if buyer.coins < total:
+        if buyer.coins_cents < total_cents:
             return TradeResult(
                 False,
                 f"{buyer.name} can't afford {quantity} {item.name}(s) "
@@ -437,16 +600,15 @@ class Market:
             )
 
         # execute the trade — transfer items with their current age
-        item_age = slot.age_days
-        seller.remove_item(item_key, quantity)
-        buyer.add_item(item_key, quantity, age_days=item_age)
-        buyer.coins = round(buyer.coins - total, 2)
+        # the seller's slot is already in hand, so skip remove_item's lookup
+        slot.quantity -= quantity
+        if not slot.quantity:
+            del seller.inventory[item_key]
+        buyer.add_item(item_key, quantity, age_days=slot.age_days)
+        buyer.coins_cents -= total_cents
         # seller revenue derived from buyer payment minus tax (no coin creation)
-        rep_tax_relief = min(seller.reputation * 0.08, 0.80)
-        effective_tax = self.TAX_RATE * (1 - rep_tax_relief)
-        tax = round(total * effective_tax, 2)
-        seller_revenue = round(total - tax, 2)
-        seller.coins = round(seller.coins + seller_revenue, 2)
+        tax_cents = round(total_cents * self._effective_tax(seller))
+        seller.coins_cents += total_cents - tax_cents
 
         # reputation
         buyer.trades_completed += 1
@@ -461,41 +623,48 @@ class Market:
             buyer.name, seller.name, item.name, quantity, total,
         )
         self.trade_log.append(result)
+        self._trade_count += 1
+        self._volume[item.name] = self._volume.get(item.name, 0) + quantity
+        self._coins_exchanged_cents += total_cents
         return result
 
     # --- bulk pricing & summaries -------------------------------------------
 
     def price_board(self) -> list[dict]:
         """Return a list of dicts suitable for display as a price board."""
+        season_name = self._season.name
+        current_price = self.current_price
         rows = []
-        for key, item in ITEMS.items():
-            rows.append({
-                "key": key,
-                "name": item.name,
-                "category": item.category.value,
-                "price": self.current_price(key),
-                "base_price": item.base_price,
-                "season": self.season.name,
-                "shelf_life": item.shelf_life or "infinite",
-            })
+        for key, template in _BOARD_TEMPLATES.items():
+            row = template.copy()
+            row["price"] = current_price(key)
+            row["season"] = season_name
+            rows.append(row)
         return rows
 
     def trade_summary(self) -> dict:
-        """Aggregate stats from the trade log."""
-        if not self.trade_log:
-            return {"total_trades": 0, "total_volume": 0, "top_item": None}
-        volume: dict[str, int] = {}
-        for t in self.trade_log:
-            if t.success:
-                volume[t.item_name] = volume.get(t.item_name, 0) + t.quantity
-        top = max(volume, key=volume.get) if volume else None  # type: ignore[arg-type]
+        """Aggregate stats over every successful trade.
+
+        The same keys come back whether or not any trades have happened;
+        an empty market reports ``coins_exchanged`` as 0.0.
+        """
+        if not self._trade_count:
+            return {
+                "total_trades": 0,
+                "total_volume": 0,
+                "top_item": None,
+                "coins_exchanged": 0.0,
+            }
+        top, top_qty, total_volume = None, -1, 0
+        for name, qty in self._volume.items():
+            total_volume += qty
+            if qty > top_qty:
+                top, top_qty = name, qty
         return {
-            "total_trades": len([t for t in self.trade_log if t.success]),
-            "total_volume": sum(volume.values()),
+            "total_trades": self._trade_count,
+            "total_volume": total_volume,
             "top_item": top,
-            "coins_exchanged": round(
-                sum(t.total_price for t in self.trade_log if t.success), 2
-            ),
+            "coins_exchanged": self._coins_exchanged_cents / 100,
         }
 
 
@@ -506,6 +675,8 @@ class Market:
 class IngredientShop:
     """Sells raw ingredients to villagers at fluctuating prices."""
 
+    __slots__ = ("season", "_seasonal_modifiers")
+
     def __init__(self, season: Season = Season.SPRING) -> None:
         self.season = season
         self._seasonal_modifiers: dict[str, dict[Season, float]] = {
@@ -529,13 +700,14 @@ class IngredientShop:
         unit = self.price(ingredient_name)
         if unit is None:
             return f"Unknown ingredient: {ingredient_name}"
-        total = round(unit * qty, 2)
-        if villager.coins < total:
+        total_cents = round(unit * 100) * qty
+        total = total_cents / 100
+        if villager.coins_cents < total_cents:
             return (
                 f"{villager.name} can't afford {qty} {ingredient_name} "
                 f"(costs {total}, has {villager.coins})"
             )
-        villager.coins = round(villager.coins - total, 2)
+        villager.coins_cents -= total_cents
         villager.add_ingredient(ingredient_name, qty)
         return f"{villager.name} bought {qty} {ingredient_name} for {total} coins."
 
@@ -547,6 +719,8 @@ class IngredientShop:
 class Village:
     """Ties together villagers, market, and ingredient shop."""
 
+    __slots__ = ("name", "villagers", "market", "shop")
+
     def __init__(self, name: str = "Willowbrook", season: Season = Season.SPRING):
         self.name = name
         self.villagers: dict[str, Villager] = {}
@@ -559,17 +733,24 @@ class Village:
     def get_villager(self, name: str) -> Optional[Villager]:
         return self.villagers.get(name)
 
-    def advance_day(self) -> list[str]:
-        events = self.market.advance_day(list(self.villagers.values()))
+    def tick(self) -> list[tuple]:
+        """Advance a day and return the market's raw event tuples."""
+        events = self.market.tick(self.villagers.values())
         # sync season to shop
         self.shop.season = self.market.season
         return events
 
+    def advance_day(self) -> list[str]:
+        format_event = self.market.format_event
+        return [format_event(e) for e in self.tick()]
+
     def simulate_days(self, n: int) -> list[str]:
-        all_events: list[str] = []
+        raw: list[tuple] = []
+        extend, tick = raw.extend, self.tick
         for _ in range(n):
-            all_events.extend(self.advance_day())
-        return all_events
+            extend(tick())
+        format_event = self.market.format_event
+        return [format_event(e) for e in raw]
 
     # --- convenience ---------------------------------------------------------
 
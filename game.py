@@ -17,28 +17,32 @@ Usage::
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from itertools import islice
 from typing import Optional
 
 # Import the village systems — each has its own Season enum, so we
 # canonicalise on the villagers module's version for the game layer.
 from villagers import (
-    Season, TimeOfDay, Village, Villager, Mood, Gift, GiftCategory,
+    Season, Village, Villager, Gift, GiftCategory,
     create_sample_village,
 )
 from weather import (
-    WeatherEngine, Forecast, Sky, MagicalEvent,
-    eligible_festivals, compute_village_mood, VillageMood,
+    WeatherEngine, Forecast, Sky,
+    eligible_festivals, compute_village_mood,
+    Season as WeatherSeason,
 )
 from garden import (
     Garden, WeatherEffect, CropType, Harvest, CropQuality,
-    SEASONAL_CROPS, ALL_CROPS,
+    Season as GardenSeason,
 )
 from animals import (
-    PetManager, Pet, Species, PetPersonality, FoundItem,
-    create_adoptable_pets,
+    PetManager, Pet, PetActivity, Species, PetPersonality,
+    Season as AnimalSeason,
 )
 
+__all__ = ["CozyVillageGame", "DailyReport"]
+
 
 # ---------------------------------------------------------------------------
 # Sky → simplified weather mapping (for garden & pets)
@@ -70,8 +74,18 @@ _SKY_TO_PET_WEATHER: dict[Sky, str] = {
     Sky.HAIL: "stormy",
 }
 
+# Skies severe enough to drive villagers indoors.
+_BAD_SKIES: frozenset[Sky] = frozenset({Sky.THUNDERSTORM, Sky.BLIZZARD, Sky.HAIL})
+
+# Everything advance_day needs from the sky, so a day costs one lookup
+# (Sky values are strings, so there is no ordinal to index a tuple by).
+_SKY_DAY_EFFECTS: dict[Sky, tuple[WeatherEffect, str, bool]] = {
+    sky: (_SKY_TO_WEATHER_EFFECT[sky], _SKY_TO_PET_WEATHER[sky], sky in _BAD_SKIES)
+    for sky in Sky
+}
+
 # Weather module uses its own Season enum, so we need a mapping.
-_SEASON_MAP = {
+_SEASON_MAP: dict[Season, str] = {
     Season.SPRING: "spring",
     Season.SUMMER: "summer",
     Season.AUTUMN: "autumn",
@@ -79,29 +93,55 @@ _SEASON_MAP = {
 }
 
 
-def _to_weather_season(s: Season):
+# villagers.Season → each subsystem's Season, built once at import.
+_WEATHER_SEASONS: dict[Season, WeatherSeason] = {s: WeatherSeason(s.value) for s in Season}
+_GARDEN_SEASONS: dict[Season, GardenSeason] = {s: GardenSeason(s.value) for s in Season}
+_ANIMAL_SEASONS: dict[Season, AnimalSeason] = {s: AnimalSeason(s.value) for s in Season}
+
+
+def _to_weather_season(s: Season) -> WeatherSeason:
     """Convert villagers.Season to weather.Season."""
-    from weather import Season as WSeason
-    return WSeason(s.value)
+    return _WEATHER_SEASONS[s]
 
 
-def _to_garden_season(s: Season):
+def _to_garden_season(s: Season) -> GardenSeason:
     """Convert villagers.Season to garden.Season."""
-    from garden import Season as GSeason
-    return GSeason(s.value)
+    return _GARDEN_SEASONS[s]
 
 
-def _to_animal_season(s: Season):
+def _to_animal_season(s: Season) -> AnimalSeason:
     """Convert villagers.Season to animals.Season."""
-    from animals import Season as ASeason
-    return ASeason(s.value)
+    return _ANIMAL_SEASONS[s]
+
+
+# Harvest → gift conversion.  Crops are matched by name: CropType's
+# dataclass hash walks its season tuple, a str hash is cached.
+_FLOWER_CROP_NAMES: frozenset[str] = frozenset({
+    "Tulip", "Sunflower", "Lavender", "Winter Rose", "Moonbloom", "Chamomile",
+})
+_FORAGED_CROP_NAMES: frozenset[str] = frozenset({"Sage", "Basil", "Frost Mint"})
+_HARVEST_GIFT_QUALITY: dict[CropQuality, int] = {
+    CropQuality.NORMAL: 1,
+    CropQuality.SILVER: 2,
+    CropQuality.GOLD: 3,
+    CropQuality.IRIDESCENT: 5,
+}
+
+# Forecasts kept for mood and streak queries — a full year.  The history
+# is trimmed back to this once it reaches twice the length, so appends
+# stay amortised O(1) while memory stays bounded on long runs.
+_WEATHER_HISTORY_DAYS: int = 4 * 28
+
+# Village event-log entries kept by the default game; reports only ever
+# show the last ten.
+_VILLAGE_EVENT_LOG_LIMIT: int = 500
 
 
 # ---------------------------------------------------------------------------
 # Daily report
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DailyReport:
     """Summary of everything that happened in one day."""
     day: int
@@ -134,26 +174,16 @@ class DailyReport:
         lines.append(f"  Village mood: {self.village_mood}")
         lines.append(sep)
 
-        if self.villager_events:
-            lines.append("  Villagers:")
-            for e in self.villager_events[:8]:  # cap for readability
-                lines.append(f"    {e}")
-        if self.garden_events:
-            lines.append("  Garden:")
-            for e in self.garden_events[:6]:
-                lines.append(f"    {e}")
-        if self.harvests:
-            lines.append("  Harvests:")
-            for h in self.harvests:
-                lines.append(f"    {h}")
-        if self.pet_events:
-            lines.append("  Pets:")
-            for e in self.pet_events[:6]:
-                lines.append(f"    {e}")
-        if self.found_items:
-            lines.append("  Found items:")
-            for i in self.found_items:
-                lines.append(f"    {i}")
+        for heading, entries, cap in (
+            ("Villagers", self.villager_events, 8),  # cap for readability
+            ("Garden", self.garden_events, 6),
+            ("Harvests", self.harvests, None),
+            ("Pets", self.pet_events, 6),
+            ("Found items", self.found_items, None),
+        ):
+            if entries:
+                lines.append(f"  {heading}:")
+                lines.extend([f"    {e}" for e in islice(entries, cap)])
 
         lines.append(sep)
         return "\n".join(lines)
@@ -180,6 +210,9 @@ class CozyVillageGame:
         self.garden = garden
         self.pets = pet_manager
         self._rng = random.Random(seed)
+        # Villager names handed to the pets, rebuilt when the roster changes
+        self._roster: tuple[Villager, ...] = ()
+        self._villager_names: list[str] = []
         self._weather_history: list[Forecast] = []
         self._daily_reports: list[DailyReport] = []
         self._day: int = 0
@@ -190,6 +223,7 @@ class CozyVillageGame:
     def create_default(cls, seed: int = 42) -> CozyVillageGame:
         """Create a ready-to-play game with all default content."""
         village = create_sample_village()
+        village.event_log_limit = _VILLAGE_EVENT_LOG_LIMIT
         weather_engine = WeatherEngine(seed=seed)
         garden = Garden(4, 6, owner="Player")
         pet_manager = PetManager()
@@ -197,15 +231,21 @@ class CozyVillageGame:
 
     # -- Main game loop -------------------------------------------------------
 
-    def advance_day(self) -> DailyReport:
-        """Simulate one full day across all systems and return a report."""
+    def advance_day(self, report: bool = True) -> Optional[DailyReport]:
+        """Simulate one full day across all systems and return a report.
+
+        With ``report=False`` the day is simulated identically but no
+        DailyReport is assembled or kept, and None is returned.
+        """
         self._day += 1
 
         # 1. Advance weather
         forecast = self.weather.advance()
-        self._weather_history.append(forecast)
-        weather_effect = _SKY_TO_WEATHER_EFFECT.get(forecast.sky, WeatherEffect.SUNNY)
-        pet_weather = _SKY_TO_PET_WEATHER.get(forecast.sky, "sunny")
+        history = self._weather_history
+        history.append(forecast)
+        if len(history) >= 2 * _WEATHER_HISTORY_DAYS:
+            del history[:-_WEATHER_HISTORY_DAYS]
+        weather_effect, pet_weather, is_bad = _SKY_DAY_EFFECTS[forecast.sky]
 
         # Magical weather → special garden bonus
         if forecast.is_magical:
@@ -213,20 +253,19 @@ class CozyVillageGame:
 
         # 2. Determine season + tell the village
         season = self.village.season
-        garden_season = _to_garden_season(season)
-        animal_season = _to_animal_season(season)
+        garden_season = _GARDEN_SEASONS[season]
+        animal_season = _ANIMAL_SEASONS[season]
 
-        is_bad = forecast.sky in {
-            Sky.THUNDERSTORM, Sky.BLIZZARD, Sky.HAIL,
-        }
         self.village.set_weather(is_bad)
 
         # 3. Advance villagers through all time slots
-        villager_events: list[str] = []
-        for _ in range(5):  # dawn → night
-            summary = self.village.advance_time()
-        # Grab the last few event log entries for the report
-        villager_events = self.village.event_log[-10:]
+        self.village.advance_time_slots(5)  # dawn → night
+
+        # The roster only changes when someone moves in.
+        roster = self.village.roster()
+        if roster is not self._roster:
+            self._roster = roster
+            self._villager_names = [v.name for v in roster]
 
         # 4. Garden: water + grow + harvest
         self.garden.season = garden_season
@@ -235,44 +274,44 @@ class CozyVillageGame:
 
         # Auto-harvest ripe crops
         harvests = self.garden.harvest_all()
-        harvest_strs = [h.display for h in harvests]
 
         # Villagers comment on the garden if there are crops
         if harvests and self._rng.random() < 0.4:
-            commenter = self._rng.choice(list(self.village.villagers.values()))
+            commenter = self._rng.choice(roster)
             crop_name = harvests[0].crop.name
             garden_events.append(
                 f'{commenter.name}: "Your {crop_name} looks wonderful!"'
             )
 
         # 5. Pets: daily activities
-        villager_names = [v.name for v in self.village.villagers.values()]
         pet_events = self.pets.advance_day(
-            animal_season, pet_weather, villager_names,
+            animal_season, pet_weather, self._villager_names,
         )
 
-        # Collect newly found items
+        # 6. One pass over the pets: collect newly found items, and apply
+        # pet-villager bond effects — if a pet greeted a villager, boost that
+        # villager's friendship with owner
         found_today: list[str] = []
+        fresh_finds = report and self._day == self.pets.day
+        villagers = self.village.villagers  # already keyed by villager id
         for pet in self.pets.pets.values():
-            for item in pet.found_items[-1:]:  # last item if any
-                if self._day == self.pets.day:
-                    found_today.append(f"{pet.name} found: {item.name}")
-
-        # 6. Pet-villager bond effects
-        # If a pet greeted a villager, boost that villager's friendship with owner
-        for pet in self.pets.pets.values():
-            if pet.activity.value == "greeting a villager" and pet.favourite_villager:
-                villager = self.village.get_villager(pet.favourite_villager)
+            if fresh_finds and pet.found_items:
+                found_today.append(f"{pet.name} found: {pet.found_items[-1].name}")
+            if pet.activity is PetActivity.GREETING and pet.favourite_villager:
+                villager = villagers.get(pet.favourite_villager)
                 if villager:
                     villager.adjust_mood(1)
 
+        if not report:
+            return None
+
         # 7. Festivals check
         festivals = eligible_festivals(forecast)
 
         # 8. Village mood from weather
         v_mood = compute_village_mood(self._weather_history)
 
-        report = DailyReport(
+        daily = DailyReport(
             day=self._day,
             season=season.value.title(),
             weather_summary=forecast.short_summary(),
@@ -281,17 +320,26 @@ class CozyVillageGame:
             magical_event=forecast.magical_event.value if forecast.is_magical else "",
             festivals=festivals,
             village_mood=v_mood.value,
-            villager_events=villager_events,
+            # the last few village log entries
+            villager_events=self.village.event_log[-10:],
             garden_events=garden_events,
             pet_events=pet_events,
-            harvests=harvest_strs,
+            harvests=[h.display for h in harvests],
             found_items=found_today,
         )
-        self._daily_reports.append(report)
-        return report
-
-    def simulate_days(self, n: int) -> list[DailyReport]:
-        """Run multiple days and return all reports."""
+        self._daily_reports.append(daily)
+        return daily
+
+    def simulate_days(self, n: int, collect: bool = True) -> list[DailyReport]:
+        """Run multiple days and return all reports.
+
+        Pass ``collect=False`` to only advance the simulation; no reports
+        are built and an empty list is returned.
+        """
+        if not collect:
+            for _ in range(n):
+                self.advance_day(report=False)
+            return []
         return [self.advance_day() for _ in range(n)]
 
     # -- Player actions -------------------------------------------------------
@@ -317,20 +365,15 @@ class CozyVillageGame:
     ) -> Optional[str]:
         """Gift harvested produce to a villager — quality affects friendship."""
         # Convert harvest to a Gift
+        crop_name = harvest.crop.name
         category = GiftCategory.FOOD
-        if harvest.crop.name in ("Tulip", "Sunflower", "Lavender", "Winter Rose",
-                                  "Moonbloom", "Chamomile"):
+        if crop_name in _FLOWER_CROP_NAMES:
             category = GiftCategory.FLOWER
-        elif harvest.crop.name in ("Sage", "Basil", "Frost Mint"):
+        elif crop_name in _FORAGED_CROP_NAMES:
             category = GiftCategory.FORAGED
-        quality = {
-            CropQuality.NORMAL: 1,
-            CropQuality.SILVER: 2,
-            CropQuality.GOLD: 3,
-            CropQuality.IRIDESCENT: 5,
-        }.get(harvest.quality, 1)
+        quality = _HARVEST_GIFT_QUALITY.get(harvest.quality, 1)
         gift = Gift(
-            f"Fresh {harvest.crop.name}", category, quality=quality,
+            f"Fresh {crop_name}", category, quality=quality,
         )
         return self.village.give_gift_to("player", villager_id, gift)
 
@@ -364,16 +407,18 @@ class CozyVillageGame:
             f"  WILLOWBROOK — Day {self._day}, {self.village.season.value.title()}",
             "=" * 60,
         ]
-        if self.current_weather:
-            lines.append(f"\n  Weather: {self.current_weather.short_summary()}")
-            lines.append(f"  {self.current_weather.description}")
-
-        lines.append(f"\n  Villagers: {len(self.village.villagers)}")
-        for v in self.village.villagers.values():
-            lines.append(
-                f"    {v.name} ({v.personality.value}) — "
-                f"{v.mood.value}, at {v.current_location}"
-            )
+        weather = self.current_weather
+        if weather:
+            lines.append(f"\n  Weather: {weather.short_summary()}")
+            lines.append(f"  {weather.description}")
+
+        roster = self.village.roster()
+        lines.append(f"\n  Villagers: {len(roster)}")
+        lines.extend([
+            f"    {v.name} ({v.personality.value}) — "
+            f"{v.mood.value}, at {v.current_location}"
+            for v in roster
+        ])
 
         lines.append(f"\n{self.garden.status()}")
         lines.append(f"\n{self.pets.status_report()}")
@@ -381,8 +426,7 @@ class CozyVillageGame:
         friendships = self.village.friendship_report()
         if friendships:
             lines.append("\n  Friendships:")
-            for f in friendships[:10]:
-                lines.append(f"    {f}")
+            lines.extend([f"    {f}" for f in friendships[:10]])
 
         lines.append("=" * 60)
         return "\n".join(lines)
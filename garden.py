@@ -12,9 +12,15 @@ from __future__ import annotations
 import enum
 import math
 import random
+from bisect import bisect_right, insort
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Bound once; ``random.seed()`` still governs every draw.
+_rand = random.random
+_randint = random.randint
+_choice = random.choice
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -27,6 +33,13 @@ class Season(enum.Enum):
     WINTER = "winter"
 
 
+# One bit per season, so a crop's seasons fold into a single int mask.
+for _i, _season in enumerate(Season):
+    _season._bit = 1 << _i
+del _i, _season
+_WINTER_BIT = Season.WINTER._bit
+
+
 class GrowthStage(enum.Enum):
     """Lifecycle of a planted crop."""
     SEED = "seed"
@@ -48,6 +61,12 @@ _STAGE_ORDER = [
     GrowthStage.FLOWERING,
     GrowthStage.HARVESTABLE,
 ]
+_STAGE_INDEX: dict[GrowthStage, int] = {s: i for i, s in enumerate(_STAGE_ORDER)}
+
+# growth_progress needed to enter each stage of _STAGE_ORDER.  Each stage
+# covers ~25% of total growth except harvestable (the rest).
+_STAGE_THRESHOLDS: tuple[float, ...] = (0.0, 0.15, 0.40, 0.70, 1.0)
+_STAGE_COUNT = len(_STAGE_ORDER)
 
 
 class CropQuality(enum.Enum):
@@ -59,17 +78,22 @@ class CropQuality(enum.Enum):
 
     @property
     def price_multiplier(self) -> float:
-        return {
-            "Normal": 1.0,
-            "Silver": 1.5,
-            "Gold": 2.2,
-            "Iridescent": 3.5,
-        }[self.value]
+        return self._price_multiplier
 
     @property
     def gift_bonus(self) -> int:
         """Extra friendship points when gifting produce of this quality."""
-        return {"Normal": 0, "Silver": 2, "Gold": 5, "Iridescent": 10}[self.value]
+        return self._gift_bonus
+
+
+# Per-tier modifiers, stored on the members so the properties are a plain
+# attribute read rather than a dict built on every call.
+for _quality, _price, _gift in zip(
+    CropQuality, (1.0, 1.5, 2.2, 3.5), (0, 2, 5, 10), strict=True,
+):
+    _quality._price_multiplier = _price
+    _quality._gift_bonus = _gift
+del _quality, _price, _gift
 
 
 class SoilType(enum.Enum):
@@ -94,9 +118,17 @@ class CropType:
     regrow_days: int = 0       # days between re-harvests
     description: str = ""
     is_magical: bool = False
+    # Bitwise OR of the seasons' bits; derived, so kept out of eq/hash.
+    _season_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        mask = 0
+        for s in self.seasons:
+            mask |= s._bit
+        object.__setattr__(self, "_season_mask", mask)
 
     def can_grow_in(self, season: Season) -> bool:
-        return season in self.seasons
+        return bool(self._season_mask & season._bit)
 
 
 # -- Spring crops --
@@ -255,6 +287,16 @@ COMPANION_PAIRS: set[frozenset[str]] = {
     frozenset({"Moonbloom", "Crystal Berry"}),
 }
 
+# Each crop name → the names it pairs with, so a neighbour check is one
+# set probe rather than building a frozenset per neighbour.
+COMPANIONS_OF: dict[str, frozenset[str]] = {}
+for _pair in COMPANION_PAIRS:
+    for _name in _pair:
+        # a one-name pair means the crop companions itself
+        _others = _pair - {_name} or _pair
+        COMPANIONS_OF[_name] = COMPANIONS_OF.get(_name, frozenset()) | _others
+del _pair, _name, _others
+
 COMPANION_GROWTH_BONUS = 0.15  # 15 % faster growth
 
 
@@ -278,6 +320,10 @@ class GardenPlot:
     quality_score: float = 0.0     # accumulated care quality
     harvests_taken: int = 0
     _withered: bool = False
+    # Set by the owning Garden, which plant() and clear() notify: whether a
+    # neighbour is a companion crop.
+    _companion: bool = field(default=False, repr=False, compare=False)
+    _garden: Optional[Garden] = field(default=None, repr=False, compare=False)
 
     @property
     def is_empty(self) -> bool:
@@ -302,6 +348,8 @@ class GardenPlot:
         self.quality_score = 0.0
         self.harvests_taken = 0
         self._withered = False
+        if self._garden is not None:
+            self._garden._crop_changed(self)
         return f"Planted {crop.name} seeds. {crop.description}"
 
     def water(self) -> str:
@@ -328,6 +376,8 @@ class GardenPlot:
         self.quality_score = 0.0
         self.harvests_taken = 0
         self._withered = False
+        if self._garden is not None:
+            self._garden._crop_changed(self)
         return f"Cleared the {name} from this plot."
 
     def harvest(self) -> Optional[Harvest]:
@@ -356,13 +406,18 @@ class Harvest:
     crop: CropType
     quality: CropQuality
     quantity: int
+    # Derived once: a Harvest is frozen, so its value never changes.
+    _sell_value: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def sell_value(self) -> float:
-        return round(
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_sell_value", round(
             self.crop.base_sell_price * self.quality.price_multiplier * self.quantity,
             2,
-        )
+        ))
+
+    @property
+    def sell_value(self) -> float:
+        return self._sell_value
 
     @property
     def display(self) -> str:
@@ -372,6 +427,13 @@ class Harvest:
         )
 
 
+# Minimum care score for each tier above NORMAL, in _QUALITY_TIERS order.
+_QUALITY_THRESHOLDS: tuple[float, ...] = (0.8, 1.4, 2.0)
+_QUALITY_TIERS: tuple[CropQuality, ...] = (
+    CropQuality.NORMAL, CropQuality.SILVER, CropQuality.GOLD, CropQuality.IRIDESCENT,
+)
+
+
 def _determine_quality(
     quality_score: float, soil: SoilType, crop: CropType,
 ) -> CropQuality:
@@ -383,22 +445,15 @@ def _determine_quality(
         base += 0.7
     if crop.is_magical:
         base *= 0.8  # magical crops are harder to perfect
-    roll = random.random() * 0.3
-    final = base + roll
-    if final >= 2.0:
-        return CropQuality.IRIDESCENT
-    if final >= 1.4:
-        return CropQuality.GOLD
-    if final >= 0.8:
-        return CropQuality.SILVER
-    return CropQuality.NORMAL
+    roll = _rand() * 0.3
+    return _QUALITY_TIERS[bisect_right(_QUALITY_THRESHOLDS, base + roll)]
 
 
 def _harvest_yield(quality: CropQuality) -> int:
     """Higher quality sometimes yields more produce."""
     base = 1
     if quality in (CropQuality.GOLD, CropQuality.IRIDESCENT):
-        base += random.randint(0, 1)
+        base += _randint(0, 1)
     return base
 
 
@@ -445,10 +500,19 @@ class Garden:
         self.owner = owner
         self.rows = rows
         self.cols = cols
-        self.plots: list[list[GardenPlot]] = [
-            [GardenPlot(r, c) for c in range(cols)]
-            for r in range(rows)
+        # Row-major; the plot at (r, c) lives at index r * cols + c.
+        self._plots: list[GardenPlot] = [
+            GardenPlot(r, c, _garden=self)
+            for r in range(rows) for c in range(cols)
         ]
+        # Row view over the same plots; plots are never replaced, so it
+        # is built once.
+        self._grid: tuple[tuple[GardenPlot, ...], ...] = tuple(
+            tuple(self._plots[r * cols:(r + 1) * cols]) for r in range(rows)
+        )
+        # Sorted indices of plots that hold a crop, kept up to date by
+        # _crop_changed so the daily tick never visits empty tiles.
+        self._planted: list[int] = []
         self.day: int = 0
         self.season: Season = Season.SPRING
         self.event_log: list[str] = []
@@ -456,19 +520,30 @@ class Garden:
 
     # -- Access helpers -------------------------------------------------------
 
+    @property
+    def plots(self) -> tuple[tuple[GardenPlot, ...], ...]:
+        """The plots as a read-only grid of rows.
+
+        The grid cannot be assigned into; change a plot through its own
+        methods (or :meth:`plant`) instead.
+        """
+        return self._grid
+
     def get_plot(self, row: int, col: int) -> Optional[GardenPlot]:
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.plots[row][col]
+            return self._plots[row * self.cols + col]
         return None
 
     def all_plots(self) -> list[GardenPlot]:
-        return [p for row in self.plots for p in row]
+        return self._plots[:]
 
     def planted_plots(self) -> list[GardenPlot]:
-        return [p for p in self.all_plots() if not p.is_empty]
+        plots = self._plots
+        return [plots[i] for i in self._planted]
 
     def harvestable_plots(self) -> list[GardenPlot]:
-        return [p for p in self.all_plots() if p.is_harvestable]
+        harvestable = GrowthStage.HARVESTABLE
+        return [p for p in self.planted_plots() if p.stage is harvestable]
 
     # -- Planting & watering --------------------------------------------------
 
@@ -514,33 +589,39 @@ class Garden:
 
         growth_mult = _WEATHER_GROWTH.get(weather, 1.0)
         quality_mod = _WEATHER_QUALITY.get(weather, 0.0)
+        # Per-day constants, hoisted out of the per-plot loop
+        season = self.season
+        season_bit = season._bit
+        is_frost = weather is WeatherEffect.FROST
+        companion_mult = 1.0 + COMPANION_GROWTH_BONUS
+        planted = self.planted_plots()
 
         # Rain auto-waters
         if weather in (WeatherEffect.RAINY, WeatherEffect.STORMY):
-            for plot in self.planted_plots():
+            for plot in planted:
                 if not plot.watered_today and plot.stage.is_alive:
                     plot.watered_today = True
                     plot.times_watered += 1
             events.append("The rain waters the garden for you.")
 
-        for plot in self.planted_plots():
+        for plot in planted:
             if plot._withered or plot.stage is GrowthStage.WITHERED:
                 continue
             crop = plot.crop
             plot.days_planted += 1
 
             # Season mismatch: crops wither outside their season
-            if not crop.can_grow_in(self.season):
+            if not crop._season_mask & season_bit:
                 plot._withered = True
                 plot.stage = GrowthStage.WITHERED
                 events.append(
                     f"The {crop.name} at ({plot.row},{plot.col}) withered "
-                    f"in the {self.season.value} chill."
+                    f"in the {season.value} chill."
                 )
                 continue
 
             # Frost damages non-winter crops
-            if weather is WeatherEffect.FROST and Season.WINTER not in crop.seasons:
+            if is_frost and not crop._season_mask & _WINTER_BIT:
                 plot.quality_score -= 2.0
                 events.append(
                     f"Frost nipped the {crop.name} at ({plot.row},{plot.col})!"
@@ -553,28 +634,23 @@ class Garden:
 
             # Growth calculation
             if plot.stage is not GrowthStage.HARVESTABLE:
-                watered_bonus = 1.3 if plot.watered_today else 0.7
-                companion_bonus = (
-                    1.0 + COMPANION_GROWTH_BONUS
-                    if self._has_companion(plot) else 1.0
-                )
+                watered = plot.watered_today
+                watered_bonus = 1.3 if watered else 0.7
+                companion_bonus = companion_mult if plot._companion else 1.0
                 daily_growth = (1.0 / crop.days_to_grow) * growth_mult * watered_bonus * companion_bonus
 
-                plot.growth_progress += daily_growth
-                plot.quality_score += quality_mod * (0.5 if not plot.watered_today else 1.0)
-
-                # Advance through growth stages
-                stage_idx = _STAGE_ORDER.index(plot.stage)
-                # Each stage covers ~25% of total growth except harvestable (the rest)
-                thresholds = [0.0, 0.15, 0.40, 0.70, 1.0]
-                for i in range(stage_idx + 1, len(thresholds)):
-                    if plot.growth_progress >= thresholds[i]:
-                        old_stage = plot.stage
-                        plot.stage = _STAGE_ORDER[i]
-                        if plot.stage is not old_stage:
-                            events.append(
-                                _growth_description(crop, plot.stage, plot.row, plot.col)
-                            )
+                progress = plot.growth_progress + daily_growth
+                plot.growth_progress = progress
+                plot.quality_score += quality_mod * (1.0 if watered else 0.5)
+
+                # Advance through growth stages; thresholds only rise, so
+                # stop at the first one not yet reached.
+                i = _STAGE_INDEX[plot.stage] + 1
+                while i < _STAGE_COUNT and progress >= _STAGE_THRESHOLDS[i]:
+                    stage = _STAGE_ORDER[i]
+                    plot.stage = stage
+                    events.append(_growth_description(crop, stage, plot.row, plot.col))
+                    i += 1
 
             # Reset daily watering
             plot.watered_today = False
@@ -585,14 +661,33 @@ class Garden:
         """Check if any adjacent plot has a companion-planting partner."""
         if plot.crop is None:
             return False
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        friends = COMPANIONS_OF.get(plot.crop.name)
+        if not friends:
+            return False
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
             neighbor = self.get_plot(plot.row + dr, plot.col + dc)
-            if neighbor and neighbor.crop:
-                pair = frozenset({plot.crop.name, neighbor.crop.name})
-                if pair in COMPANION_PAIRS:
-                    return True
+            if neighbor and neighbor.crop and neighbor.crop.name in friends:
+                return True
         return False
 
+    def _crop_changed(self, plot: GardenPlot) -> None:
+        """Update the planted index and companion flags after plant/clear."""
+        idx = plot.row * self.cols + plot.col
+        pos = bisect_right(self._planted, idx)
+        was_planted = pos > 0 and self._planted[pos - 1] == idx
+        if plot.crop is not None and not was_planted:
+            insort(self._planted, idx)
+        elif plot.crop is None and was_planted:
+            del self._planted[pos - 1]
+        self._refresh_companions(plot.row, plot.col)
+
+    def _refresh_companions(self, row: int, col: int) -> None:
+        """Recompute the cached companion flag around a changed plot."""
+        for dr, dc in ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)):
+            plot = self.get_plot(row + dr, col + dc)
+            if plot is not None:
+                plot._companion = self._has_companion(plot)
+
     # -- Display --------------------------------------------------------------
 
     def status(self) -> str:
@@ -604,10 +699,9 @@ class Garden:
             f"Harvestable: {len(self.harvestable_plots())}",
             "",
         ]
-        for r in range(self.rows):
+        for row in self.plots:
             row_parts = []
-            for c in range(self.cols):
-                plot = self.plots[r][c]
+            for plot in row:
                 if plot.is_empty:
                     row_parts.append("[      ]")
                 else:
@@ -675,7 +769,7 @@ def _growth_description(crop: CropType, stage: GrowthStage, row: int, col: int)
     templates = _GROWTH_DESCRIPTIONS.get(stage, [])
     if not templates:
         return f"The {crop.name} at ({row},{col}) has changed."
-    text = random.choice(templates).format(crop=crop.name)
+    text = _choice(templates).format(crop=crop.name)
     return f"({row},{col}) {text}"
 
 
@@ -164,7 +164,7 @@ def _serialize_garden(g):
         "season": g.season.value,
         "day": g.day,
         "total_harvests": g.total_harvests,
-        "plots": [[_serialize_plot(g.plots[r][c]) for c in range(g.cols)] for r in range(g.rows)],
+        "plots": [[_serialize_plot(p) for p in row] for row in g.plots],
     }
 
 
@@ -183,7 +183,7 @@ def _serialize_pet(p):
             {
                 "name": item.name,
                 "category": item.category,
-                "rarity": item.rarity,
+                "rarity": item.rarity.label,
                 "description": item.description,
                 "value": item.value,
             }
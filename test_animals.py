@@ -6,6 +6,7 @@ import random
 
 import pytest
 
+import animals
 from animals import (
     BondTier,
     FoundItem,
@@ -14,6 +15,7 @@ from animals import (
     PetManager,
     PetMood,
     PetPersonality,
+    Rarity,
     Season,
     Species,
     SpeciesProfile,
@@ -138,6 +140,18 @@ class TestPet:
         pet.forage(Season.SPRING)
         assert pet.energy < starting_energy
 
+    def test_devoted_bond_boosts_forage_mid_day(self, monkeypatch):
+        # A roll between the curious cat's base chance (0.43) and the
+        # devoted chance (0.53) only succeeds once the bond is devoted.
+        monkeypatch.setattr(animals, "_rand", lambda: 0.5)
+        pet = Pet("Whiskers", Species.CAT, PetPersonality.CURIOUS)
+        pet.start_new_day()
+        assert pet.forage(Season.SPRING) is None
+        pet.bond_points = animals._DEVOTED_BOND_POINTS - 1
+        pet.feed()  # crosses into DEVOTED without a new day
+        assert pet.bond_tier is BondTier.DEVOTED
+        assert pet.forage(Season.SPRING) is not None
+
     def test_forage_fails_when_exhausted(self):
         pet = Pet("Bramble", Species.HEDGEHOG, PetPersonality.GENTLE)
         pet.energy = 5
@@ -278,6 +292,37 @@ class TestFoundItem:
         rare = FoundItem("Fossil", "stick", "rare", "A fossil.")
         assert common.value < uncommon.value < rare.value
 
+    def test_rarity_label_coerced(self):
+        item = FoundItem("Stick", "stick", "uncommon", "A stick.")
+        assert item.rarity is Rarity.UNCOMMON
+        assert item.rarity.label == "uncommon"
+
+    def test_unknown_rarity_valued_at_one(self):
+        item = FoundItem("Pebble", "stone", "mythic", "A pebble.")
+        assert item.rarity is Rarity.UNKNOWN
+        assert item.rarity.label == "unknown"
+        assert item.value == 1.0
+
+    def test_unknown_rarity_flows_through_reports(self, monkeypatch):
+        pebble = FoundItem("Pebble", "stone", "mythic", "A pebble.")
+        monkeypatch.setitem(
+            animals._SPECIES_FORAGE_POOLS, Species.CAT, (([pebble], [1.0]),),
+        )
+        monkeypatch.setattr(animals, "_rand", lambda: 0.0)
+        manager = PetManager()
+        pet = manager.adopt("Whiskers", Species.CAT, PetPersonality.CURIOUS)
+        events = manager.advance_day(Season.SPRING, "sunny")
+        assert any("Pebble! (unknown)" in e for e in events)
+        assert pet.found_items == [pebble]
+
+    def test_unknown_rarity_serializes(self):
+        server = pytest.importorskip("server")  # needs the web stack
+        pet = Pet("Whiskers", Species.CAT, PetPersonality.CURIOUS)
+        pet.found_items.append(FoundItem("Pebble", "stone", "mythic", "A pebble."))
+        found = server._serialize_pet(pet)["found_items"]
+        assert found[0]["rarity"] == "unknown"
+        assert found[0]["value"] == 1.0
+
 
 class TestAdoptablePets:
     def test_catalogue_not_empty(self):
@@ -0,0 +1,194 @@
+"""
+Tests for crafting.py — Crafting System
+"""
+
+import random
+
+import pytest
+
+from crafting import (
+    ALL_MATERIALS,
+    ALL_RECIPES,
+    CLAY,
+    COTTON,
+    CraftedItem,
+    Crafter,
+    InsufficientMaterialError,
+    Inventory,
+    Material,
+    OAK_WOOD,
+    PINE_WOOD,
+    QualityTier,
+    RECIPE_OAK_CHAIR,
+    RECIPE_WOODEN_HAMMER,
+    Season,
+    SeasonRestrictionError,
+    STARDUST,
+    Workstation,
+    craft,
+    recipes_for_workstation,
+    recipes_using,
+    seasonal_materials,
+)
+
+
+class TestSeasonFlags:
+    def test_seasons_are_distinct_bits(self):
+        masks = [int(s) for s in Season]
+        assert len(set(masks)) == 4
+        assert all(m & (m - 1) == 0 for m in masks)
+
+    def test_available_in_matches_seasons(self):
+        for material in ALL_MATERIALS:
+            for s in Season:
+                assert material.available_in(s) == (s in material.seasons)
+
+    def test_all_season_default(self):
+        ore = Material("Test Ore")
+        for s in Season:
+            assert ore.available_in(s)
+
+    def test_seasonal_materials(self):
+        assert COTTON in seasonal_materials(Season.SUMMER)
+        assert COTTON not in seasonal_materials(Season.WINTER)
+        assert STARDUST in seasonal_materials(Season.WINTER)
+        assert CLAY not in seasonal_materials(Season.WINTER)
+
+    def test_seasonal_materials_combined_flag(self):
+        combined = seasonal_materials(Season.SUMMER | Season.WINTER)
+        assert COTTON in combined
+        assert STARDUST in combined
+        assert combined == [
+            m for m in ALL_MATERIALS
+            if m.available_in(Season.SUMMER) or m.available_in(Season.WINTER)
+        ]
+
+    def test_gather_out_of_season(self):
+        crafter = Crafter("Ada")
+        with pytest.raises(SeasonRestrictionError):
+            crafter.gather(STARDUST, Season.SUMMER)
+
+
+class TestInventory:
+    def test_add_and_remove(self):
+        inv = Inventory()
+        inv.add_material(OAK_WOOD, 3)
+        inv.remove_material(OAK_WOOD, 2)
+        assert inv.material_count(OAK_WOOD) == 1
+
+    def test_remove_too_many(self):
+        inv = Inventory()
+        inv.add_material(OAK_WOOD, 1)
+        with pytest.raises(InsufficientMaterialError):
+            inv.remove_material(OAK_WOOD, 2)
+
+    def test_material_summary_is_a_snapshot(self):
+        inv = Inventory()
+        inv.add_material(OAK_WOOD, 2)
+        summary = inv.material_summary
+        inv.add_material(PINE_WOOD, 1)
+        assert summary == {"Oak Wood": 2}
+
+    def test_consume_materials_for(self):
+        inv = Inventory()
+        inv.add_material(OAK_WOOD, 5)
+        inv.add_material(PINE_WOOD, 1)
+        assert inv.consume_materials_for(RECIPE_WOODEN_HAMMER) == []
+        assert inv.material_summary == {"Oak Wood": 2}
+
+    def test_consume_shortfall_takes_nothing(self):
+        inv = Inventory()
+        inv.add_material(OAK_WOOD, 5)
+        shortfalls = inv.consume_materials_for(RECIPE_WOODEN_HAMMER)
+        assert shortfalls == ["Need 1x Pine Wood (have 0)."]
+        assert inv.material_count(OAK_WOOD) == 5
+
+    def test_consume_false_only_checks(self):
+        inv = Inventory()
+        inv.add_material(OAK_WOOD, 3)
+        inv.add_material(PINE_WOOD, 1)
+        assert inv.consume_materials_for(RECIPE_WOODEN_HAMMER, consume=False) == []
+        assert inv.material_count(OAK_WOOD) == 3
+
+
+class TestCraft:
+    def _stocked_crafter(self) -> Crafter:
+        crafter = Crafter("Ada")
+        crafter.inventory.add_material(OAK_WOOD, 4)
+        crafter.inventory.add_material(PINE_WOOD, 1)
+        return crafter
+
+    def test_craft_success_consumes_materials(self):
+        random.seed(42)
+        crafter = self._stocked_crafter()
+        result = craft(
+            crafter, RECIPE_WOODEN_HAMMER,
+            available_workstation=Workstation.WORKBENCH,
+        )
+        assert result.success
+        assert result.item.recipe is RECIPE_WOODEN_HAMMER
+        assert crafter.inventory.material_summary == {"Oak Wood": 1}
+        assert crafter.inventory.items == [result.item]
+        assert result.xp_gained > 0
+
+    def test_craft_missing_materials(self):
+        crafter = Crafter("Ada")
+        crafter.inventory.add_material(OAK_WOOD, 2)
+        result = craft(
+            crafter, RECIPE_WOODEN_HAMMER,
+            available_workstation=Workstation.WORKBENCH,
+        )
+        assert not result.success
+        assert "Need 3x Oak Wood (have 2)." in result.errors
+        assert crafter.inventory.material_count(OAK_WOOD) == 2
+
+    def test_failed_craft_keeps_materials(self):
+        crafter = self._stocked_crafter()
+        result = craft(crafter, RECIPE_WOODEN_HAMMER)  # no workbench
+        assert not result.success
+        assert any("workbench" in e for e in result.errors)
+        assert crafter.inventory.material_summary == {"Oak Wood": 4, "Pine Wood": 1}
+
+    def test_furniture_comfort(self):
+        random.seed(42)
+        crafter = self._stocked_crafter()
+        crafter.skill_level = 5
+        result = craft(
+            crafter, RECIPE_OAK_CHAIR,
+            available_workstation=Workstation.WORKBENCH,
+        )
+        assert result.success
+        assert result.item.comfort > 0
+        assert crafter.inventory.total_comfort == result.item.comfort
+
+    def test_total_comfort_follows_items(self):
+        item = CraftedItem(RECIPE_OAK_CHAIR, QualityTier.ROUGH, "Ada")
+        inv = Inventory()
+        inv.add_item(item)
+        item.comfort = 7.5
+        assert inv.total_comfort == 7.5
+
+    def test_display_name_follows_quality(self):
+        item = CraftedItem(RECIPE_OAK_CHAIR, QualityTier.ROUGH, "Ada")
+        item.quality = QualityTier.FINE
+        assert item.display_name == "Fine Oak Chair"
+
+
+class TestRecipeLookups:
+    def test_recipes_for_workstation(self):
+        for station in Workstation:
+            expected = tuple(r for r in ALL_RECIPES if r.workstation is station)
+            assert recipes_for_workstation(station) == expected
+        assert RECIPE_WOODEN_HAMMER in recipes_for_workstation(Workstation.WORKBENCH)
+
+    def test_recipes_using(self):
+        for material in ALL_MATERIALS:
+            expected = tuple(
+                r for r in ALL_RECIPES
+                if any(m.name == material.name for m, _ in r.ingredients)
+            )
+            assert recipes_using(material) == expected
+        assert RECIPE_OAK_CHAIR in recipes_using(OAK_WOOD)
+
+    def test_recipes_using_unknown_material(self):
+        assert recipes_using(Material("Pebble")) == ()
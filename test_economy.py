@@ -9,6 +9,7 @@ from economy import (
     IngredientShop,
     InventorySlot,
     Market,
+    MarketEvent,
     Season,
     Villager,
 )
@@ -124,6 +125,65 @@ class TestSeasonalScarcity:
             assert coins_spent_expensive > coins_spent_cheap
 
 
+# ---------------------------------------------------------------------------
+# Coin ledger
+# ---------------------------------------------------------------------------
+
+
+class TestCoinLedger:
+    """Coins are kept as integer cents so repeated purchases never drift."""
+
+    def test_repeated_purchases_stay_exact(self):
+        v = Villager("Saver", coins=1.0)
+        shop = IngredientShop(Season.AUTUMN)
+        for _ in range(3):
+            shop.buy(v, "yeast")  # 0.15 each
+        assert v.coins_cents == 55
+        assert v.coins == 0.55
+
+    def test_coins_setter_rounds_to_cents(self):
+        v = Villager("Setter")
+        v.coins = 7.254
+        assert v.coins_cents == 725
+        assert v.coins == 7.25
+
+
+# ---------------------------------------------------------------------------
+# Price board caching
+# ---------------------------------------------------------------------------
+
+
+class TestPriceBoard:
+    def test_board_follows_season_change(self):
+        m = Market(Season.SPRING)
+        spring = m.price_board()
+        assert m.price_board() == spring
+        m.season = Season.WINTER
+        winter = m.price_board()
+        assert {row["season"] for row in winter} == {"WINTER"}
+        loaf = next(r for r in winter if r["key"] == "sourdough_loaf")
+        assert loaf["price"] == m.current_price("sourdough_loaf")
+
+    def test_board_follows_noise_refresh(self):
+        m = Market(Season.SPRING)
+        m.price_board()
+        m.price_noise = {key: 1.0 for key in ITEMS}
+        for row in m.price_board():
+            assert row["price"] == ITEMS[row["key"]].price_in_season(Season.SPRING)
+
+    def test_board_follows_in_place_noise_edit(self):
+        m = Market(Season.SPRING)
+        m.price_board()
+        m.price_noise["sourdough_loaf"] = 1.0
+        loaf = next(r for r in m.price_board() if r["key"] == "sourdough_loaf")
+        assert loaf["price"] == m.current_price("sourdough_loaf")
+
+    def test_board_rows_are_fresh_copies(self):
+        m = Market(Season.SPRING)
+        m.price_board()[0]["price"] = -1.0
+        assert m.price_board()[0]["price"] == m.current_price(m.price_board()[0]["key"])
+
+
 # ---------------------------------------------------------------------------
 # Spoilage age transfer through trades
 # ---------------------------------------------------------------------------
@@ -223,3 +283,115 @@ class TestSpoilageAgeTransfer:
         slot = buyer.inventory["sourdough_loaf"]
         assert slot.quantity == 2
         assert slot.age_days == 4  # max(1, 4)
+
+    def test_merging_older_stock_marks_spoiled(self):
+        """Merging in stock past shelf life spoils the whole slot."""
+        buyer = Villager("Buyer", coins=100)
+        buyer.add_item("lavender_scone", 1, age_days=0)  # shelf_life 3
+        assert not buyer.inventory["lavender_scone"].is_spoiled
+        buyer.add_item("lavender_scone", 1, age_days=3)
+        assert buyer.inventory["lavender_scone"].is_spoiled
+
+    def test_spoiled_follows_direct_age_assignment(self):
+        """Setting age_days directly is reflected in is_spoiled."""
+        buyer = Villager("Buyer", coins=100)
+        buyer.add_item("lavender_scone", 1)  # shelf_life 3
+        slot = buyer.inventory["lavender_scone"]
+        slot.age_days = 3
+        assert slot.is_spoiled
+        slot.age_days = 0
+        assert not slot.is_spoiled
+
+    def test_age_inventory_discards_spoiled(self):
+        """Aging a day drops perishables that hit shelf life and keeps the rest."""
+        v = Villager("Ager", coins=100)
+        v.add_item("cinnamon_roll", 1, age_days=3)  # shelf_life 4
+        v.add_item("sourdough_loaf", 1, age_days=0)
+        v.add_item("healing_potion", 1, age_days=50)  # never spoils
+        assert v.age_inventory() == ["cinnamon_roll"]
+        assert v.inventory["sourdough_loaf"].age_days == 1
+        assert v.inventory["healing_potion"].age_days == 51
+
+
+# ---------------------------------------------------------------------------
+# Trade summary
+# ---------------------------------------------------------------------------
+
+
+class TestTradeSummary:
+    def test_empty_market(self):
+        m = Market(Season.SPRING)
+        assert m.trade_summary() == {
+            "total_trades": 0, "total_volume": 0, "top_item": None,
+            "coins_exchanged": 0.0,
+        }
+
+    def test_counts_only_successful_trades(self):
+        m = Market(Season.SPRING)
+        seller = Villager("Seller", coins=0)
+        buyer = Villager("Buyer", coins=100)
+        seller.add_item("honey_cake", 3)
+        seller.add_item("cinnamon_roll", 1)
+        r1 = m.trade(buyer, seller, "honey_cake", 2)
+        r2 = m.trade(buyer, seller, "cinnamon_roll", 1)
+        failed = m.trade(buyer, seller, "cinnamon_roll", 1)
+        assert r1.success and r2.success and not failed.success
+        summary = m.trade_summary()
+        assert summary["total_trades"] == 2
+        assert summary["total_volume"] == 3
+        assert summary["top_item"] == "Honey Cake"
+        assert summary["coins_exchanged"] == round(r1.total_price + r2.total_price, 2)
+
+    def test_bounded_log_keeps_full_summary(self):
+        m = Market(Season.SPRING, log_capacity=1)
+        seller = Villager("Seller", coins=0)
+        buyer = Villager("Buyer", coins=100)
+        seller.add_item("honey_cake", 3)
+        for _ in range(3):
+            assert m.trade(buyer, seller, "honey_cake").success
+        assert len(m.trade_log) == 1
+        assert m.trade_summary()["total_trades"] == 3
+
+
+# ---------------------------------------------------------------------------
+# Market calendar
+# ---------------------------------------------------------------------------
+
+
+class TestMarketCalendar:
+    def test_season_changes_after_28_days(self):
+        m = Market(Season.SPRING)
+        for _ in range(27):
+            m.advance_day([])
+        assert m.season is Season.SPRING
+        events = m.advance_day([])
+        assert m.day == 29
+        assert m.season is Season.SUMMER
+        assert events[0] == "Season changed from SPRING to SUMMER!"
+
+    def test_schedule_follows_day_set_directly(self):
+        m = Market(Season.SPRING)
+        m.day = 55
+        assert m.advance_day([]) == ["Market prices shifted with supply and demand."]
+        assert m.advance_day([])[0] == "Season changed from SPRING to SUMMER!"
+
+    def test_day_zero_schedules_first_season_change(self):
+        m = Market(Season.SPRING)
+        m.day = 0
+        assert m.advance_day([]) == []
+        assert m.day == 1
+        assert m.season is Season.SPRING
+        for _ in range(28):
+            m.advance_day([])
+        assert m.day == 29
+        assert m.season is Season.SUMMER
+
+    def test_tick_returns_raw_events(self):
+        m = Market(Season.SPRING)
+        v = Villager("Baker")
+        v.add_item("berry_tart", 1, age_days=2)  # shelf_life 3
+        events = m.tick([v])
+        assert events == [(MarketEvent.SPOILED, "Baker", "berry_tart")]
+        assert m.format_event(events[0]) == (
+            "Baker's Berry Tart spoiled and was discarded."
+        )
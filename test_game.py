@@ -276,3 +276,35 @@ class TestFullSeasonSimulation:
         assert game.current_weather is None
         game.advance_day()
         assert game.current_weather is not None
+
+    def test_weather_history_is_bounded(self):
+        game = CozyVillageGame.create_default()
+        game.simulate_days(300)
+        assert len(game._weather_history) < 2 * 4 * 28
+        assert game.current_weather is game._weather_history[-1]
+
+    def test_village_event_log_is_bounded(self):
+        random.seed(42)
+        game = CozyVillageGame.create_default(seed=42)
+        reports = game.simulate_days(400)
+        limit = game.village.event_log_limit
+        assert limit is not None
+        assert len(game.village.event_log) <= 2 * limit
+        assert reports[-1].villager_events == game.village.event_log[-10:]
+
+    def test_headless_days_match_reported_days(self):
+        def run(collect: bool) -> tuple[CozyVillageGame, str]:
+            random.seed(42)
+            game = CozyVillageGame.create_default(seed=42)
+            game.adopt_pet("Biscuit", Species.DOG, PetPersonality.LOYAL)
+            game.plant_crop(0, 0, PEA)
+            game.simulate_days(20, collect=collect)
+            return game, game.advance_day().render()
+
+        reported, reported_day21 = run(True)
+        headless, headless_day21 = run(False)
+        assert len(reported._daily_reports) == 21
+        assert len(headless._daily_reports) == 1
+        assert headless_day21 == reported_day21
+        assert headless.garden_status() == reported.garden_status()
+        assert headless.pet_status() == reported.pet_status()
@@ -9,6 +9,7 @@ import pytest
 from garden import (
     ALL_CROPS,
     COMPANION_PAIRS,
+    COMPANIONS_OF,
     COMPANION_GROWTH_BONUS,
     SEASONAL_CROPS,
     CropQuality,
@@ -54,6 +55,11 @@ class TestCropType:
         for s in Season:
             assert CRYSTAL_BERRY.can_grow_in(s)
 
+    def test_can_grow_in_matches_seasons(self):
+        for crop in ALL_CROPS:
+            for s in Season:
+                assert crop.can_grow_in(s) == (s in crop.seasons)
+
     def test_magical_flag(self):
         assert MOONBLOOM.is_magical
         assert STARFRUIT.is_magical
@@ -215,12 +221,35 @@ class TestGarden:
         assert garden.cols == 4
         assert len(garden.all_plots()) == 12
 
+    def test_plot_grid_layout(self):
+        garden = Garden(3, 4)
+        assert [len(row) for row in garden.plots] == [4, 4, 4]
+        for r in range(3):
+            for c in range(4):
+                plot = garden.get_plot(r, c)
+                assert (plot.row, plot.col) == (r, c)
+                assert garden.plots[r][c] is plot
+        assert garden.plots is garden.plots
+        with pytest.raises(TypeError):
+            garden.plots[0][0] = GardenPlot(0, 0)
+        assert garden.get_plot(3, 0) is None
+        assert garden.get_plot(0, -1) is None
+
     def test_plant(self):
         garden = Garden(3, 4)
         msg = garden.plant(0, 0, STRAWBERRY)
         assert "Planted" in msg
         assert len(garden.planted_plots()) == 1
 
+    def test_planted_plots_track_plant_and_clear(self):
+        garden = Garden(3, 4)
+        garden.plant(2, 1, STRAWBERRY)
+        garden.plant(0, 3, PEA)
+        garden.plant(0, 3, TULIP)  # occupied, no change
+        assert [(p.row, p.col) for p in garden.planted_plots()] == [(0, 3), (2, 1)]
+        garden.get_plot(0, 3).clear()
+        assert [(p.row, p.col) for p in garden.planted_plots()] == [(2, 1)]
+
     def test_plant_invalid_position(self):
         garden = Garden(3, 4)
         msg = garden.plant(99, 99, STRAWBERRY)
@@ -308,6 +337,17 @@ class TestGarden:
         plot = garden.get_plot(0, 0)
         assert not garden._has_companion(plot)
 
+    def test_companion_flag_follows_plant_and_clear(self):
+        garden = Garden(3, 4)
+        garden.plant(0, 0, STRAWBERRY)
+        plot = garden.get_plot(0, 0)
+        assert not plot._companion
+        garden.plant(0, 1, BASIL)
+        assert plot._companion
+        assert garden.get_plot(0, 1)._companion
+        garden.get_plot(0, 1).clear()
+        assert not plot._companion
+
     def test_status_display(self):
         garden = Garden(3, 4)
         garden.plant(0, 0, STRAWBERRY)
@@ -358,5 +398,13 @@ class TestCompanionPairs:
         assert frozenset({"Strawberry", "Basil"}) in COMPANION_PAIRS
         assert frozenset({"Tomato", "Basil"}) in COMPANION_PAIRS
 
+    def test_companions_of_matches_pairs(self):
+        for a, friends in COMPANIONS_OF.items():
+            for b in friends:
+                assert frozenset({a, b}) in COMPANION_PAIRS
+        for pair in COMPANION_PAIRS:
+            for name in pair:
+                assert pair <= COMPANIONS_OF[name] | {name}
+
     def test_growth_bonus_positive(self):
         assert COMPANION_GROWTH_BONUS > 0
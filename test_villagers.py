@@ -123,6 +123,32 @@ class TestSeasonalSchedules:
         # Lily's spring morning schedule: "selling flowers" at Town Plaza
         assert lily._activity == "selling flowers"
 
+    def test_roster_refreshes_on_arrival(self):
+        village = create_sample_village()
+        roster = village.roster()
+        assert village.roster() is roster
+        assert list(roster) == list(village.villagers.values())
+        lily = village.get_villager("lily")
+        assert lily is not None
+        newcomer = Villager("wren", "Wren", Personality.SHY, lily.home)
+        village.add_villager(newcomer)
+        assert village.roster()[-1] is newcomer
+
+    def test_advance_time_slots_matches_advance_time(self):
+        """Bulk slot advancing leaves the village where repeated
+        advance_time calls would."""
+        random.seed(3)
+        stepped = create_sample_village()
+        for _ in range(12):
+            stepped.advance_time()
+        random.seed(3)
+        bulk = create_sample_village()
+        bulk.advance_time_slots(12)
+        assert (bulk.day, bulk.time_of_day) == (stepped.day, stepped.time_of_day)
+        assert bulk.event_log == stepped.event_log
+        for vid, v in bulk.villagers.items():
+            assert v.current_location == stepped.villagers[vid].current_location
+
 
 # ---------------------------------------------------------------------------
 # 2. Weather integration with weather.py
@@ -591,9 +591,13 @@ class Villager:
 class Village:
     """Manages a collection of villagers, locations, and the day/time cycle."""
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, event_log_limit: Optional[int] = None) -> None:
         self.name = name
+        # When set, the event log keeps roughly this many recent entries
+        # (trimmed once it doubles); None keeps everything.
+        self.event_log_limit = event_log_limit
         self.villagers: dict[str, Villager] = {}
+        self._roster: Optional[tuple[Villager, ...]] = None
         self.locations: dict[str, Location] = {}
         self.day: int = 1
         self.season: Season = Season.SPRING
@@ -612,6 +616,13 @@ class Village:
 
     def add_villager(self, villager: Villager) -> None:
         self.villagers[villager.villager_id] = villager
+        self._roster = None
+
+    def roster(self) -> tuple[Villager, ...]:
+        """All villagers in arrival order, cached until the next arrival."""
+        if self._roster is None:
+            self._roster = tuple(self.villagers.values())
+        return self._roster
 
     def get_villager(self, villager_id: str) -> Optional[Villager]:
         return self.villagers.get(villager_id)
@@ -630,6 +641,17 @@ class Village:
 
     def advance_time(self) -> str:
         """Advance one time-of-day slot, rolling over to next day/season as needed."""
+        summaries = self._advance_slot()
+        header = f"--- Day {self.day}, {self.season.value.title()}, {self.time_of_day.value} ---"
+        return "\n".join([header] + summaries)
+
+    def advance_time_slots(self, n: int) -> None:
+        """Advance *n* time slots without building the slot summaries."""
+        for _ in range(n):
+            self._advance_slot()
+
+    def _advance_slot(self) -> list[str]:
+        """Move to the next slot and return each villager's summary line."""
         idx = self._TIME_ORDER.index(self.time_of_day)
         if idx + 1 < len(self._TIME_ORDER):
             self.time_of_day = self._TIME_ORDER[idx + 1]
@@ -651,8 +673,10 @@ class Village:
             )
 
         self._trigger_random_encounters()
-        header = f"--- Day {self.day}, {self.season.value.title()}, {self.time_of_day.value} ---"
-        return "\n".join([header] + summaries)
+        limit = self.event_log_limit
+        if limit is not None and len(self.event_log) > 2 * limit:
+            del self.event_log[:-limit]
+        return summaries
 
     def _on_new_day(self) -> None:
         for v in self.villagers.values():
@@ -607,8 +607,13 @@ def compute_village_mood(recent: list[Forecast], window: int = 5) -> VillageMood
         return VillageMood.CONTENT
 
     tail = recent[-window:]
-    avg_score = sum(_SKY_MOOD_SCORE.get(f.sky, 0.5) for f in tail) / len(tail)
-    magic_count = sum(1 for f in tail if f.is_magical)
+    score = 0.0
+    magic_count = 0
+    for f in tail:  # one pass for both the score and the magic count
+        score += _SKY_MOOD_SCORE.get(f.sky, 0.5)
+        if f.is_magical:
+            magic_count += 1
+    avg_score = score / len(tail)
 
     if magic_count >= 2:
         return VillageMood.ENCHANTED